@@ -9,12 +9,127 @@ import inspect
 from pathlib import Path
 from collections import defaultdict
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 # Remove django import to avoid dependency
 # import django
 # from django.conf import settings
 
 class DjangoProjectParser:
-    def __init__(self, project_path):
+    # Queryset methods whose keyword arguments / positional strings reference model fields
+    QUERY_METHODS = ["filter", "exclude", "get", "get_or_create", "update_or_create", "order_by"]
+    
+    # Queryset methods that return rows even without a filter (Post.objects.all())
+    ROW_LOADING_METHODS = [
+        "all", "select_related", "prefetch_related", "annotate", "distinct",
+        "only", "defer", "values", "values_list", "iterator"
+    ]
+    
+    # Queryset methods that end a chain in a single row, a scalar or a write instead of a row set
+    SINGLE_RESULT_METHODS = ["count", "exists", "aggregate", "first", "last", "latest", "earliest", "update", "delete"]
+    
+    # Field lookups that may terminate a lookup path (e.g. author__username__iexact)
+    LOOKUP_SUFFIXES = [
+        "exact", "iexact", "contains", "icontains", "in", "gt", "gte", "lt", "lte",
+        "startswith", "istartswith", "endswith", "iendswith", "range", "isnull",
+        "regex", "iregex", "date", "year", "month", "day", "week", "week_day",
+        "quarter", "time", "hour", "minute", "second", "search", "unaccent", "trigram_similar"
+    ]
+    
+    # Lookups that only benefit from a B-tree index in their leading, anchored form
+    UNINDEXABLE_LOOKUPS = ["contains", "icontains", "endswith", "iendswith", "regex", "iregex", "iexact", "istartswith"]
+    
+    # Files scanned for ORM call sites in each app
+    QUERY_SOURCE_FILES = ["views.py", "viewsets.py", "api.py", "forms.py", "serializers.py", "managers.py", "models.py"]
+    
+    # Modules that commonly hold views (DRF projects often keep viewsets apart)
+    VIEW_FILES = ["views.py", "viewsets.py", "api.py"]
+    
+    # Assumptions used when turning per-object query counts into per-request estimates
+    ASSUMED_PAGE_SIZE = 25
+    ASSUMED_RELATED_OBJECTS = 5
+    
+    # Queryset methods on a related manager that always hit the database, even when prefetched
+    UNCACHED_RELATED_CALLS = ["filter", "exclude", "get", "count", "exists", "aggregate", "order_by", "latest", "first", "last"]
+    
+    # Migration operations that lock or rewrite tables, or run arbitrary code
+    COSTLY_MIGRATION_OPERATIONS = {
+        "RunPython": "Runs Python code; cannot be optimized away when squashing unless elidable",
+        "RunSQL": "Runs raw SQL; cannot be optimized away when squashing unless elidable",
+        "AddIndex": "Builds an index while holding a lock (consider AddIndexConcurrently)",
+        "AlterField": "Changes the column definition, which may rewrite the table or rebuild an index",
+        "AddField": "Adds a NOT NULL column with a default, which may rewrite the table",
+        "AlterUniqueTogether": "Builds a unique index while holding a lock",
+        "AddConstraint": "Validates the constraint against every existing row",
+    }
+    
+    # Field arguments that change the database column; an AlterField touching only others
+    # (help_text, verbose_name, choices, default, ...) is a no-op for the schema
+    SCHEMA_FIELD_ATTRIBUTES = [
+        "max_length", "null", "db_index", "unique", "primary_key", "max_digits",
+        "decimal_places", "db_column", "db_collation", "to"
+    ]
+    
+    # Apps with at least this many unsquashed migrations are reported as squash candidates
+    SQUASH_THRESHOLD = 10
+    
+    # Approximate stored bytes of fixed-width columns as (PostgreSQL, MySQL, SQLite)
+    FIXED_FIELD_BYTES = {
+        "AutoField": (4, 4, 4), "BigAutoField": (8, 8, 8), "SmallAutoField": (2, 2, 2),
+        "IntegerField": (4, 4, 4), "BigIntegerField": (8, 8, 8), "SmallIntegerField": (2, 2, 2),
+        "PositiveIntegerField": (4, 4, 4), "PositiveBigIntegerField": (8, 8, 8),
+        "PositiveSmallIntegerField": (2, 2, 2), "FloatField": (8, 8, 8),
+        "BooleanField": (1, 1, 1), "NullBooleanField": (1, 1, 1),
+        "DateField": (4, 3, 10), "DateTimeField": (8, 8, 26), "TimeField": (8, 3, 15),
+        "DurationField": (16, 8, 8), "UUIDField": (16, 32, 32),
+        "GenericIPAddressField": (19, 39, 39), "IPAddressField": (15, 15, 15),
+    }
+    
+    # Default max_length of Django's variable-length fields
+    DEFAULT_MAX_LENGTHS = {
+        "CharField": 255, "SlugField": 50, "EmailField": 254, "URLField": 200,
+        "FileField": 100, "ImageField": 100, "FilePathField": 100,
+    }
+    
+    # Unbounded columns PostgreSQL compresses / moves out of line (TOAST) and InnoDB stores off-page
+    LARGE_FIELD_TYPES = ["TextField", "JSONField", "BinaryField", "ArrayField", "HStoreField", "SearchVectorField"]
+    ASSUMED_LARGE_COLUMN_BYTES = 1024
+    
+    # In-row pointer left by an out-of-line value (PostgreSQL TOAST pointer, InnoDB off-page pointer);
+    # SQLite keeps the value in the row and spills the whole record to overflow pages
+    OUT_OF_LINE_POINTER_BYTES = (18, 20, None)
+    
+    # Per-row overhead (PostgreSQL tuple header + item pointer, InnoDB record header, SQLite cell header)
+    ROW_OVERHEAD_BYTES = (28, 20, 4)
+    
+    TOAST_THRESHOLD_BYTES = 2032
+    INNODB_INLINE_ROW_BYTES = 8126
+    WIDE_TABLE_COLUMNS = 30
+    
+    # ModelAdmin options relevant to changelist and change form query cost
+    ADMIN_OPTIONS = [
+        "list_display", "list_filter", "search_fields", "ordering", "raw_id_fields",
+        "list_select_related", "autocomplete_fields", "readonly_fields", "fields",
+        "fieldsets", "exclude", "list_per_page", "inlines"
+    ]
+    
+    # Related models referenced by at least this many foreign keys are treated as large tables
+    LARGE_TABLE_FAN_IN = 3
+    
+    # Target of settings.AUTH_USER_MODEL / get_user_model() when settings do not override it
+    DEFAULT_AUTH_USER_MODEL = "auth.User"
+    
+    CACHE_VERSION = 3
+    
+    # Only start a worker pool when there are enough apps to amortize process start-up
+    PARALLEL_MIN_APPS = 4
+    
+    # Collections each per-app parse phase produces, merged back in app order
+    APP_PHASE_RESULTS = {
+        "models": ["models"],
+        "components": ["views", "urls", "forms", "serializers", "admins", "migrations", "query_call_sites"],
+    }
+    
+    def __init__(self, project_path, cache_path=None, settings_file=None, workers=1, setup_django=True):
         self.project_path = Path(project_path)
         self.project_name = self.project_path.name
         self.apps = []
@@ -29,24 +144,45 @@ class DjangoProjectParser:
         self.middleware = []
         self.templates = []
         self.static_files = []
+        self.query_call_sites = []
+        self.index_advice = []
+        self.migrations = []
+        self.migration_graph = {}
+        self.serializer_costs = []
+        self.admins = []
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.file_cache = {}
+        self.cache_dirty = False
+        # Cache keys hit or refreshed during this run; everything else belongs to deleted files
+        self.cache_seen = set()
+        self.settings_file = Path(settings_file) if settings_file else None
+        self.workers = workers
+        # Extra app directories by name (shared library apps discovered outside the project root)
+        self.app_locations = {}
+        # Settings of every project in a workspace parse, by project name
+        self.project_settings = {}
         self.errors = {"parsing": [], "validation": []}
         self.django_version = "Unknown"
         self.debug_mode = None
         
         # Initialize Django settings
-        self._setup_django()
+        if setup_django:
+            self._setup_django()
         
     def _setup_django(self):
         """Set up Django environment to access project settings"""
         try:
-            # Find settings module
-            settings_files = list(self.project_path.glob("**/settings.py"))
-            if not settings_files:
-                self.errors["parsing"].append("Could not find settings.py file")
-                return
+            # Find settings module (unless the caller already discovered it)
+            settings_file = self.settings_file
+            if not settings_file:
+                settings_files = list(self.project_path.glob("**/settings.py"))
+                if not settings_files:
+                    self.errors["parsing"].append("Could not find settings.py file")
+                    return
                 
-            # Get the settings module path
-            settings_file = settings_files[0]
+                # Get the settings module path
+                settings_file = settings_files[0]
+                self.settings_file = settings_file
             
             # Parse settings file directly instead of importing it
             self._parse_settings_file(settings_file)
@@ -78,6 +214,7 @@ class DjangoProjectParser:
             templates = []
             root_urlconf = None
             debug_mode = None
+            auth_user_model = None
             
             for node in ast.walk(tree):
                 if isinstance(node, ast.Assign):
@@ -122,6 +259,13 @@ class DjangoProjectParser:
                                 elif isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
                                     root_urlconf = node.value.value
                             
+                            # Extract AUTH_USER_MODEL
+                            elif target.id == "AUTH_USER_MODEL":
+                                if isinstance(node.value, ast.Str):
+                                    auth_user_model = node.value.s
+                                elif isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                                    auth_user_model = node.value.value
+                            
                             # Extract DEBUG
                             elif target.id == "DEBUG":
                                 if isinstance(node.value, ast.NameConstant):
@@ -175,6 +319,7 @@ class DjangoProjectParser:
                 "media_url": media_url,
                 "templates": templates,
                 "root_urlconf": root_urlconf,
+                "auth_user_model": auth_user_model,
             }
             
             # Store debug mode
@@ -194,8 +339,19 @@ class DjangoProjectParser:
     def parse_project(self):
         """Parse the entire Django project"""
         self._find_apps()
+        return self._parse_discovered_apps()
+    
+    def _parse_discovered_apps(self):
+        """Parse self.apps and run every analysis over the result"""
+        self._load_cache()
         self._parse_apps()
         self._find_dependencies()
+        self._analyze_indexes()
+        self._analyze_migrations()
+        self._estimate_serializer_costs()
+        self._estimate_storage()
+        self._analyze_admin()
+        self._save_cache()
         return self._generate_output()
     
     def _find_apps(self):
@@ -223,10 +379,13 @@ class DjangoProjectParser:
             # Find app directories
             for app_name in project_apps:
                 app_dir = self.project_path / app_name
+                if not app_dir.is_dir() and app_name in self.app_locations:
+                    # Shared library app living outside this project's root
+                    app_dir = self.app_locations[app_name]
                 if app_dir.exists() and app_dir.is_dir():
                     self.apps.append({
                         "name": app_name,
-                        "path": str(app_dir.relative_to(self.project_path)),
+                        "path": os.path.relpath(app_dir, self.project_path),
                         "is_project_app": True
                     })
                     
@@ -248,14 +407,77 @@ class DjangoProjectParser:
     
     def _parse_apps(self):
         """Parse each app to extract models, views, urls, etc."""
+        # One worker pool for both phases, only when there are enough apps to amortize start-up
+        executor = None
+        if self.workers > 1 and len(self.apps) >= self.PARALLEL_MIN_APPS:
+            try:
+                executor = ProcessPoolExecutor(max_workers=self.workers)
+            except Exception as e:
+                self.errors["parsing"].append(f"Worker pool unavailable, parsing serially: {str(e)}")
+        
+        try:
+            # Models first, so views, call sites and managers can resolve against every app's models
+            executor = self._run_app_phase("models", executor)
+            self._run_app_phase("components", executor)
+        finally:
+            if executor:
+                executor.shutdown()
+    
+    def _run_app_phase(self, phase, executor=None):
+        """Run one parse phase for every app, in the worker pool if given.
+        
+        Returns the executor, or None once it has failed and the remaining phases should run serially.
+        """
+        tasks = []
         for app in self.apps:
             app_path = self.project_path / app["path"]
-            
+            migrations_prefix = f"migration:{(app_path / 'migrations').resolve()}{os.sep}"
+            tasks.append({
+                "phase": phase,
+                "project_path": str(self.project_path),
+                "app": app,
+                "apps": self.apps,
+                "settings_data": self.settings_data,
+                "project_settings": self.project_settings,
+                "models": self.models if phase != "models" else [],
+                # Only ship the cache entries this app can hit
+                "file_cache": {key: value for key, value in self.file_cache.items() if key.startswith(migrations_prefix)}
+            })
+        
+        results = None
+        if executor:
+            try:
+                results = list(executor.map(_parse_app_task, tasks))
+            except Exception as e:
+                self.errors["parsing"].append(f"Worker pool unavailable, parsing serially: {str(e)}")
+                executor.shutdown()
+                executor = None
+        if results is None:
+            results = [_parse_app_task(task) for task in tasks]
+        
+        for result in results:
+            for key in self.APP_PHASE_RESULTS[phase]:
+                getattr(self, key).extend(result[key])
+            for kind, messages in result["errors"].items():
+                self.errors[kind].extend(messages)
+            if result["file_cache"]:
+                self.file_cache.update(result["file_cache"])
+                self.cache_dirty = True
+            self.cache_seen.update(result["cache_seen"])
+        
+        return executor
+    
+    def _parse_app(self, phase, app):
+        """Parse a single app for one phase and return the collected components"""
+        app_path = self.project_path / app["path"]
+        
+        if phase == "models":
             # Parse models
             self._parse_models(app["name"], app_path)
-            
+        else:
             # Parse views
-            self._parse_views(app["name"], app_path)
+            for file_name in self.VIEW_FILES:
+                self._parse_views(app["name"], app_path, file_name)
             
             # Parse urls
             self._parse_urls(app["name"], app_path)
@@ -265,6 +487,21 @@ class DjangoProjectParser:
             
             # Parse serializers (for REST API)
             self._parse_serializers(app["name"], app_path)
+            
+            # Parse admin
+            self._parse_admin(app["name"], app_path)
+            
+            # Parse migrations
+            self._parse_migrations(app["name"], app_path)
+            
+            # Collect ORM call sites (needs every app's models to resolve managers and lookups)
+            self._collect_query_call_sites(app["name"], app_path)
+        
+        result = {key: getattr(self, key) for key in self.APP_PHASE_RESULTS[phase]}
+        result["errors"] = self.errors
+        result["file_cache"] = self.file_cache if self.cache_dirty else {}
+        result["cache_seen"] = sorted(self.cache_seen)
+        return result
     
     def _parse_models(self, app_name, app_path):
         """Parse models.py to extract model definitions"""
@@ -295,6 +532,7 @@ class DjangoProjectParser:
                             "methods": [],
                             "meta": {},
                             "relationships": [],
+                            "managers": [],
                             "file_path": str(models_file)
                         }
                         
@@ -316,6 +554,17 @@ class DjangoProjectParser:
                                             for keyword in item.value.keywords:
                                                 field_attrs[keyword.arg] = self._extract_value(keyword.value)
                                         
+                                        # Custom managers (objects = PostManager() / PostQuerySet.as_manager())
+                                        if isinstance(item.value, ast.Call):
+                                            manager_name = None
+                                            if isinstance(item.value.func, ast.Name) and item.value.func.id.endswith("Manager"):
+                                                manager_name = item.value.func.id
+                                            elif isinstance(item.value.func, ast.Attribute) and item.value.func.attr == "as_manager" \
+                                                    and isinstance(item.value.func.value, ast.Name):
+                                                manager_name = item.value.func.value.id
+                                            if manager_name:
+                                                model["managers"].append(manager_name)
+                                        
                                         if field_type:
                                             field = {
                                                 "name": field_name,
@@ -326,14 +575,33 @@ class DjangoProjectParser:
                                             # Check for relationships
                                             if field_type in ["ForeignKey", "OneToOneField", "ManyToManyField"]:
                                                 rel_model = None
-                                                if item.value.args and isinstance(item.value.args[0], ast.Name):
-                                                    rel_model = item.value.args[0].id
+                                                rel_app = None
+                                                to_user_model = False
+                                                # Target is the first argument or to=
+                                                rel_node = item.value.args[0] if item.value.args else next(
+                                                    (keyword.value for keyword in item.value.keywords if keyword.arg == "to"), None
+                                                )
+                                                if isinstance(rel_node, ast.Name):
+                                                    rel_model = rel_node.id
+                                                elif isinstance(rel_node, ast.Constant) and isinstance(rel_node.value, str):
+                                                    # Lazy references: "Author", "accounts.Account" or "self"
+                                                    rel_model = rel_node.value
+                                                    if rel_model == "self":
+                                                        rel_model = node.name
+                                                    elif "." in rel_model:
+                                                        rel_app, rel_model = rel_model.rsplit(".", 1)
+                                                elif self._is_user_model_reference(rel_node):
+                                                    # settings.AUTH_USER_MODEL / get_user_model()
+                                                    rel_app, rel_model = self._auth_user_model(app_name).rsplit(".", 1)
+                                                    to_user_model = True
                                                 
                                                 relationship = {
                                                     "field_name": field_name,
                                                     "type": field_type,
                                                     "related_model": rel_model,
-                                                    "related_name": field_attrs.get("related_name")
+                                                    "related_app": rel_app,
+                                                    "related_name": field_attrs.get("related_name"),
+                                                    "to_user_model": to_user_model
                                                 }
                                                 model["relationships"].append(relationship)
                                             
@@ -360,9 +628,9 @@ class DjangoProjectParser:
         except Exception as e:
             self.errors["parsing"].append(f"Error parsing models in {app_name}: {str(e)}")
     
-    def _parse_views(self, app_name, app_path):
-        """Parse views.py to extract view definitions"""
-        views_file = app_path / "views.py"
+    def _parse_views(self, app_name, app_path, file_name="views.py"):
+        """Parse views.py (or viewsets.py / api.py) to extract view definitions"""
+        views_file = app_path / file_name
         if not views_file.exists():
             return
         
@@ -422,6 +690,10 @@ class DjangoProjectParser:
                             if base.id == "View" or "View" in base.id:
                                 is_view = True
                                 parent_views.append(base.id)
+                        elif isinstance(base, ast.Attribute) and "View" in base.attr:
+                            # generic.ListView, viewsets.ModelViewSet, generics.ListAPIView
+                            is_view = True
+                            parent_views.append(base.attr)
                     
                     if is_view:
                         view = {
@@ -460,6 +732,47 @@ class DjangoProjectParser:
                                         if model["name"] not in view["models_used"]:
                                             view["models_used"].append(model["name"])
                         
+                        # Generic views: model = Post / queryset = Post.objects.all()
+                        for model_name in self._query_context_models(node):
+                            if model_name not in view["models_used"]:
+                                view["models_used"].append(model_name)
+                        
+                        # DRF: serializer_class and the relations its queryset loads eagerly
+                        for item in node.body:
+                            if isinstance(item, ast.Assign) and isinstance(item.value, ast.Name):
+                                for target in item.targets:
+                                    if isinstance(target, ast.Name) and target.id == "serializer_class":
+                                        view["serializer_class"] = item.value.id
+                        
+                        eager_loading = {"select_related": [], "prefetch_related": []}
+                        for item in ast.walk(node):
+                            if isinstance(item, ast.Call) and isinstance(item.func, ast.Attribute) and item.func.attr in eager_loading:
+                                if not item.args:
+                                    # select_related() without arguments follows every non-null FK
+                                    eager_loading[item.func.attr].append("*")
+                                for arg in item.args:
+                                    value = self._extract_value(arg)
+                                    if isinstance(value, dict) and value["args"]:
+                                        # Prefetch("comments", queryset=...)
+                                        value = value["args"][0]
+                                    if isinstance(value, str) and value not in eager_loading[item.func.attr]:
+                                        eager_loading[item.func.attr].append(value)
+                        if eager_loading["select_related"] or eager_loading["prefetch_related"]:
+                            view["eager_loading"] = eager_loading
+                        
+                        # Column restrictions: only()/values()/values_list() and defer()
+                        column_loading = {}
+                        for item in ast.walk(node):
+                            if isinstance(item, ast.Call) and isinstance(item.func, ast.Attribute) and \
+                                    item.func.attr in ["only", "defer", "values", "values_list"]:
+                                key = "defer" if item.func.attr == "defer" else "only"
+                                for arg in item.args:
+                                    value = self._extract_value(arg)
+                                    if isinstance(value, str):
+                                        column_loading.setdefault(key, []).append(value)
+                        if column_loading:
+                            view["column_loading"] = column_loading
+                        
                         self.views.append(view)
         except Exception as e:
             self.errors["parsing"].append(f"Error parsing views in {app_name}: {str(e)}")
@@ -615,6 +928,7 @@ class DjangoProjectParser:
                             "app": app_name,
                             "parent_serializers": parent_serializers,
                             "fields": [],
+                            "methods": [],
                             "meta": {}
                         }
                         
@@ -625,20 +939,34 @@ class DjangoProjectParser:
                                     if isinstance(target, ast.Name):
                                         field_name = target.id
                                         field_type = None
+                                        field_attrs = {}
                                         
-                                        # Try to extract field type
+                                        # Try to extract field type and attributes (source, many, ...)
                                         if isinstance(item.value, ast.Call):
                                             if isinstance(item.value.func, ast.Attribute):
                                                 field_type = item.value.func.attr
                                             elif isinstance(item.value.func, ast.Name):
                                                 field_type = item.value.func.id
+                                            
+                                            for keyword in item.value.keywords:
+                                                if keyword.arg:
+                                                    field_attrs[keyword.arg] = self._extract_value(keyword.value)
                                         
                                         if field_type:
                                             serializer["fields"].append({
                                                 "name": field_name,
-                                                "type": field_type
+                                                "type": field_type,
+                                                "attributes": field_attrs
                                             })
                             
+                            # Methods (get_<field> for SerializerMethodField) and the relations they touch
+                            elif isinstance(item, ast.FunctionDef):
+                                serializer["methods"].append({
+                                    "name": item.name,
+                                    "parameters": [arg.arg for arg in item.args.args if arg.arg != "self"],
+                                    "accesses": self._extract_object_accesses(item)
+                                })
+                            
                             # Extract Meta class
                             elif isinstance(item, ast.ClassDef) and item.name == "Meta":
                                 for meta_item in item.body:
@@ -653,16 +981,332 @@ class DjangoProjectParser:
         except Exception as e:
             self.errors["parsing"].append(f"Error parsing serializers in {app_name}: {str(e)}")
     
+    def _extract_object_accesses(self, function_node):
+        """Find obj.relation[.attr...] chains (and calls on them) in a serializer method's body"""
+        if len(function_node.args.args) < 2:
+            return []
+        obj_name = function_node.args.args[1].arg
+        
+        # Only keep the outermost attribute of each chain
+        inner = set()
+        calls = {}
+        for item in ast.walk(function_node):
+            if isinstance(item, ast.Attribute) and isinstance(item.value, ast.Attribute):
+                inner.add(id(item.value))
+            elif isinstance(item, ast.Call) and isinstance(item.func, ast.Attribute):
+                calls[id(item.func)] = item
+        
+        accesses = []
+        for item in ast.walk(function_node):
+            if not isinstance(item, ast.Attribute) or id(item) in inner:
+                continue
+            
+            path = []
+            current = item
+            while isinstance(current, ast.Attribute):
+                path.insert(0, current.attr)
+                current = current.value
+            if not isinstance(current, ast.Name) or current.id != obj_name:
+                continue
+            
+            call = path.pop() if id(item) in calls and len(path) > 1 else None
+            access = {"path": "__".join(path), "call": call}
+            if access not in accesses:
+                accesses.append(access)
+        return accesses
+    
+    def _parse_admin(self, app_name, app_path):
+        """Parse admin.py to extract ModelAdmin / inline classes and their registrations"""
+        admin_file = app_path / "admin.py"
+        if not admin_file.exists():
+            return
+        
+        try:
+            with open(admin_file, "r") as f:
+                file_content = f.read()
+            
+            tree = ast.parse(file_content)
+            
+            admin_classes = {}
+            registrations = []
+            
+            def registered_models(call):
+                # register(Post), register(Post, Page) or register([Post, Page])
+                models = []
+                for arg in call.args:
+                    value = self._extract_value(arg)
+                    if isinstance(value, list):
+                        models.extend(name for name in value if isinstance(name, str))
+                    elif isinstance(value, str) and isinstance(arg, ast.Name) and self._find_model(value):
+                        models.append(value)
+                return models
+            
+            for node in ast.walk(tree):
+                if isinstance(node, ast.ClassDef):
+                    bases = [base.id if isinstance(base, ast.Name) else base.attr
+                             for base in node.bases if isinstance(base, (ast.Name, ast.Attribute))]
+                    is_inline = any(base.endswith("Inline") for base in bases)
+                    if not is_inline and not any(base.endswith("Admin") for base in bases):
+                        continue
+                    
+                    admin_class = {
+                        "name": node.name,
+                        "app": app_name,
+                        "type": "inline" if is_inline else "admin",
+                        "model": None,
+                        "bases": bases,
+                        "options": {},
+                        "methods": [],
+                        "file_path": str(admin_file)
+                    }
+                    
+                    for item in node.body:
+                        if isinstance(item, ast.Assign):
+                            for target in item.targets:
+                                if isinstance(target, ast.Name):
+                                    if target.id == "model":
+                                        admin_class["model"] = self._extract_value(item.value)
+                                    elif target.id in self.ADMIN_OPTIONS:
+                                        admin_class["options"][target.id] = self._extract_value(item.value)
+                        elif isinstance(item, ast.FunctionDef):
+                            admin_class["methods"].append({
+                                "name": item.name,
+                                "parameters": [arg.arg for arg in item.args.args if arg.arg != "self"],
+                                "accesses": self._extract_object_accesses(item)
+                            })
+                    
+                    # @admin.register(Post)
+                    for decorator in node.decorator_list:
+                        if isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute) and decorator.func.attr == "register":
+                            for model_name in registered_models(decorator):
+                                registrations.append((model_name, node.name))
+                    
+                    admin_classes[node.name] = admin_class
+                
+                # admin.site.register(Post, PostAdmin)
+                elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+                    call = node.value
+                    if isinstance(call.func, ast.Attribute) and call.func.attr == "register":
+                        admin_name = call.args[1].id if len(call.args) > 1 and isinstance(call.args[1], ast.Name) else None
+                        for model_name in registered_models(ast.Call(func=call.func, args=call.args[:1], keywords=[])):
+                            registrations.append((model_name, admin_name))
+            
+            for model_name, admin_name in registrations:
+                admin_class = admin_classes.get(admin_name)
+                if admin_class:
+                    self.admins.append(dict(admin_class, model=model_name))
+                else:
+                    # Registered with the default ModelAdmin
+                    self.admins.append({
+                        "name": "ModelAdmin",
+                        "app": app_name,
+                        "type": "admin",
+                        "model": model_name,
+                        "bases": [],
+                        "options": {},
+                        "methods": [],
+                        "file_path": str(admin_file)
+                    })
+            
+            # Inlines carry their own model
+            for admin_class in admin_classes.values():
+                if admin_class["type"] == "inline" and admin_class["model"]:
+                    self.admins.append(admin_class)
+        except Exception as e:
+            self.errors["parsing"].append(f"Error parsing admin in {app_name}: {str(e)}")
+    
+    def _analyze_admin(self):
+        """Flag changelist N+1s, unindexed search_fields and FK dropdowns on large tables"""
+        try:
+            # Models referenced by many foreign keys tend to be the big tables
+            fan_in = defaultdict(int)
+            for model in self.models:
+                for relationship in model["relationships"]:
+                    target = self._relationship_target(model, relationship)
+                    if target:
+                        fan_in[(target["app"], target["name"])] += 1
+            
+            # An inline's foreign key to its parent admin's model is never rendered
+            inline_parents = defaultdict(set)
+            for admin in self.admins:
+                parent = self._find_model(admin["model"] or "", admin["app"])
+                for inline_name in admin["options"].get("inlines") or []:
+                    if isinstance(inline_name, str) and parent:
+                        inline_parents[inline_name].add((parent["app"], parent["name"]))
+            
+            for admin in self.admins:
+                model = self._find_model(admin["model"] or "", admin["app"])
+                admin["findings"] = []
+                if not model:
+                    continue
+                
+                if admin["type"] == "admin":
+                    admin["findings"].extend(self._admin_list_display_findings(admin, model))
+                    admin["findings"].extend(self._admin_search_findings(admin, model))
+                admin["findings"].extend(self._admin_dropdown_findings(
+                    admin, model, fan_in, inline_parents.get(admin["name"], set()) if admin["type"] == "inline" else set()
+                ))
+        except Exception as e:
+            self.errors["parsing"].append(f"Error analyzing admin: {str(e)}")
+    
+    def _relation_hops(self, model, segments):
+        """Follow relation segments from a model; returns [(path, nullable)] for each forward relation hop"""
+        hops = []
+        path = ""
+        for segment in segments:
+            relationship = next((r for r in model["relationships"] if r["field_name"] == segment), None)
+            if not relationship or relationship["type"] == "ManyToManyField":
+                break
+            field = next((f for f in model["fields"] if f["name"] == segment), {"attributes": {}})
+            path = f"{path}__{segment}" if path else segment
+            hops.append((path, bool(field["attributes"].get("null"))))
+            model = self._relationship_target(model, relationship)
+            if not model:
+                break
+        return hops
+    
+    def _admin_list_display_findings(self, admin, model):
+        """list_display entries that load a related object per changelist row"""
+        options = admin["options"]
+        list_display = [entry for entry in options.get("list_display") or [] if isinstance(entry, str)]
+        list_select_related = options.get("list_select_related")
+        methods = {method["name"]: method for method in admin["methods"]}
+        
+        # Entry -> relation hops it traverses
+        traversals = []
+        has_related_field = False
+        for entry in list_display:
+            if entry in methods:
+                for access in methods[entry]["accesses"]:
+                    hops = self._relation_hops(model, access["path"].split("__"))
+                    if hops:
+                        traversals.append((entry, hops, True))
+            else:
+                hops = self._relation_hops(model, entry.split("__"))
+                if hops:
+                    has_related_field = True
+                    traversals.append((entry, hops, False))
+        
+        # Unset / True: ChangeList falls back to a bare select_related() when list_display
+        # names a relation, which only follows non-null foreign keys
+        explicit = list_select_related if isinstance(list_select_related, list) else []
+        bare_select = list_select_related is True or (not list_select_related and has_related_field)
+        
+        findings = []
+        for entry, hops, via_method in traversals:
+            path = hops[-1][0]
+            if path in explicit:
+                continue
+            covered = bare_select and not any(nullable for _, nullable in hops)
+            if covered and list_select_related is not None:
+                continue
+            findings.append({
+                "type": "list_display_fk_traversal",
+                "severity": "low" if covered else "high",
+                "field": entry,
+                "path": path,
+                "message": (
+                    f"'{entry}' reads {path}; only Django's implicit select_related() avoids a query per row, "
+                    f"set list_select_related = ['{path}']"
+                    if covered else
+                    f"'{entry}' {'calls a method that reads' if via_method else 'reads'} {path} with one query per changelist row; "
+                    f"add '{path}' to list_select_related"
+                )
+            })
+        return findings
+    
+    def _admin_search_findings(self, admin, model):
+        """search_fields searched with icontains (no prefix) on columns without a trigram index"""
+        findings = []
+        for entry in admin["options"].get("search_fields") or []:
+            if not isinstance(entry, str) or entry[:1] in ["^", "=", "@"]:
+                continue
+            # Only a bare path or an explicit __icontains is searched with icontains;
+            # _split_lookup reports a bare path as "exact", so check the suffix itself
+            path = entry
+            parts = entry.split("__")
+            if len(parts) > 1 and parts[-1] in self.LOOKUP_SUFFIXES:
+                if parts[-1] != "icontains":
+                    continue
+                path = "__".join(parts[:-1])
+            resolved = self._resolve_field_path(model, path)
+            if not resolved:
+                continue
+            target_model, field_name = resolved
+            has_gin = any(index["type"] == "gin" and field_name in index["fields"]
+                          for index in self._model_indexes(target_model))
+            if has_gin:
+                continue
+            findings.append({
+                "type": "search_field_unindexed",
+                "severity": "high",
+                "field": entry,
+                "path": f"{target_model['name']}.{field_name}",
+                "message": (
+                    f"search_fields '{entry}' runs UPPER(..) LIKE '%term%' on {target_model['name']}.{field_name}, "
+                    f"which no B-tree index can serve; add a trigram GinIndex or use '^'/'=' prefixes"
+                )
+            })
+        return findings
+    
+    def _admin_dropdown_findings(self, admin, model, fan_in, parent_models):
+        """Foreign key / M2M form widgets that render every row of a large related table"""
+        options = admin["options"]
+        
+        # Fields shown on the change form: fields / fieldsets, minus readonly and excluded fields
+        form_fields = options.get("fields")
+        if not form_fields and options.get("fieldsets"):
+            form_fields = []
+            for fieldset in options["fieldsets"]:
+                if isinstance(fieldset, list) and len(fieldset) == 2 and isinstance(fieldset[1], dict):
+                    for name in fieldset[1].get("fields") or []:
+                        form_fields.extend(name if isinstance(name, list) else [name])
+        skipped = set()
+        for key in ["raw_id_fields", "autocomplete_fields", "readonly_fields", "exclude"]:
+            skipped.update(name for name in options.get(key) or [] if isinstance(name, str))
+        
+        findings = []
+        for relationship in model["relationships"]:
+            name = relationship["field_name"]
+            if name in skipped or (isinstance(form_fields, list) and name not in form_fields):
+                continue
+            related = relationship["related_model"] or ""
+            target = self._relationship_target(model, relationship)
+            key = (target["app"], target["name"]) if target else None
+            if key in parent_models:
+                continue
+            if not self._targets_user_model(model, relationship, target) and \
+                    fan_in.get(key, 0) < self.LARGE_TABLE_FAN_IN:
+                continue
+            findings.append({
+                "type": "fk_dropdown_large_table",
+                "severity": "medium",
+                "field": name,
+                "path": related,
+                "message": (
+                    f"'{name}' renders a <select> with every {related} row; "
+                    f"add it to raw_id_fields or autocomplete_fields"
+                )
+            })
+        return findings
+    
     def _find_dependencies(self):
         """Find dependencies between components"""
         # Model to model dependencies (through relationships)
+        def model_app(model_name, app):
+            model = self._find_model(model_name or "", app) if isinstance(model_name, str) else None
+            return model["app"] if model else None
+        
         for model in self.models:
             for relationship in model["relationships"]:
                 if relationship["related_model"]:
+                    target = self._relationship_target(model, relationship)
+                    relationship["target_app"] = target["app"] if target else None
                     self.dependencies.append({
                         "source": model["name"],
                         "source_app": model["app"],
                         "target": relationship["related_model"],
+                        "target_app": relationship["target_app"],
                         "type": "model_relationship",
                         "relationship_type": relationship["type"],
                         "field_name": relationship["field_name"]
@@ -675,9 +1319,35 @@ class DjangoProjectParser:
                     "source": view["name"],
                     "source_app": view["app"],
                     "target": model_name,
+                    "target_app": model_app(model_name, view["app"]),
                     "type": "view_uses_model"
                 })
         
+        # View to serializer dependencies (DRF)
+        for view in self.views:
+            serializer = self._find_serializer(view.get("serializer_class") or "", view["app"])
+            if view.get("serializer_class"):
+                self.dependencies.append({
+                    "source": view["name"],
+                    "source_app": view["app"],
+                    "target": view["serializer_class"],
+                    "target_app": serializer["app"] if serializer else None,
+                    "type": "view_uses_serializer"
+                })
+        
+        # Admin to model dependencies
+        for admin in self.admins:
+            if admin["model"]:
+                admin["model_app"] = model_app(admin["model"], admin["app"])
+                self.dependencies.append({
+                    "source": admin["name"],
+                    "source_app": admin["app"],
+                    "target": admin["model"],
+                    "target_app": admin["model_app"],
+                    "type": "admin_uses_model",
+                    "admin_type": admin["type"]
+                })
+        
         # URL to view dependencies
         for url in self.urls:
             if url["view"]:
@@ -696,6 +1366,7 @@ class DjangoProjectParser:
                     "source": form["name"],
                     "source_app": form["app"],
                     "target": form["meta"]["model"],
+                    "target_app": model_app(form["meta"]["model"], form["app"]),
                     "type": "form_uses_model"
                 })
         
@@ -706,9 +1377,1213 @@ class DjangoProjectParser:
                     "source": serializer["name"],
                     "source_app": serializer["app"],
                     "target": serializer["meta"]["model"],
+                    "target_app": model_app(serializer["meta"]["model"], serializer["app"]),
                     "type": "serializer_uses_model"
                 })
     
+    def _collect_query_call_sites(self, app_name, app_path):
+        """Collect filter()/exclude()/order_by()/get()/all() call sites and the field paths they reference"""
+        for file_name in self.QUERY_SOURCE_FILES:
+            source_file = app_path / file_name
+            if not source_file.exists():
+                continue
+            
+            try:
+                with open(source_file, "r") as f:
+                    file_content = f.read()
+                
+                tree = ast.parse(file_content)
+                
+                # Calls already consumed as part of an outer queryset chain
+                visited = set()
+                
+                for node in tree.body:
+                    context_models = self._query_context_models(node) if isinstance(node, ast.ClassDef) else []
+                    
+                    # ast.walk is breadth-first, so the outermost call of a chain is seen first
+                    for item in ast.walk(node):
+                        if not isinstance(item, ast.Call) or id(item) in visited:
+                            continue
+                        
+                        call_site = self._extract_query_chain(item, context_models, visited)
+                        if call_site:
+                            call_site["app"] = app_name
+                            call_site["file_path"] = str(source_file)
+                            call_site["line"] = item.lineno
+                            call_site["class"] = node.name if isinstance(node, ast.ClassDef) else None
+                            self.query_call_sites.append(call_site)
+            except Exception as e:
+                self.errors["parsing"].append(f"Error collecting query call sites in {source_file}: {str(e)}")
+    
+    def _query_context_models(self, class_node):
+        """Determine which models `self` querysets refer to inside a class (views, forms, serializers, managers)"""
+        model_names = []
+        
+        # Managers and querysets attached to a model (objects = PostManager())
+        for model in self.models:
+            if class_node.name in model.get("managers", []):
+                model_names.append(model["name"])
+        
+        for item in class_node.body:
+            # Class-based views: model = Post / queryset = Post.objects.all()
+            if isinstance(item, ast.Assign):
+                for target in item.targets:
+                    if isinstance(target, ast.Name) and target.id in ["model", "queryset"]:
+                        base = item.value
+                        while isinstance(base, (ast.Call, ast.Attribute)):
+                            base = base.func if isinstance(base, ast.Call) else base.value
+                        if isinstance(base, ast.Name) and self._find_model(base.id):
+                            model_names.append(base.id)
+            
+            # ModelForm / ModelSerializer: class Meta: model = Post
+            elif isinstance(item, ast.ClassDef) and item.name == "Meta":
+                for meta_item in item.body:
+                    if isinstance(meta_item, ast.Assign) and isinstance(meta_item.value, ast.Name):
+                        for target in meta_item.targets:
+                            if isinstance(target, ast.Name) and target.id == "model" and self._find_model(meta_item.value.id):
+                                model_names.append(meta_item.value.id)
+        
+        return model_names
+    
+    def _extract_query_chain(self, node, context_models, visited):
+        """Walk a queryset method chain down to its base and record the field references along it"""
+        filters = []
+        ordering = []
+        chain = []
+        model_names = []
+        
+        # get_object_or_404(Post, slug=slug)
+        if isinstance(node.func, ast.Name) and node.func.id in ["get_object_or_404", "get_list_or_404"]:
+            if node.args and isinstance(node.args[0], ast.Name) and self._find_model(node.args[0].id):
+                self._extract_query_arguments("get", node, filters, ordering)
+                return {
+                    "model": node.args[0].id,
+                    "chain": ["get"],
+                    "filters": filters,
+                    "ordering": ordering
+                }
+            return None
+        
+        if not isinstance(node.func, ast.Attribute) or node.func.attr not in (
+            self.QUERY_METHODS + self.ROW_LOADING_METHODS + self.SINGLE_RESULT_METHODS
+        ):
+            return None
+        
+        # Accessors allowed between `self` and the queryset call, so that
+        # self.request.user.posts.filter() is not attributed to the view's model
+        self_accessors = ["objects", "_default_manager", "get_queryset", "model", "queryset"]
+        via_self_ok = True
+        
+        current = node
+        while True:
+            if isinstance(current, ast.Call):
+                visited.add(id(current))
+                if isinstance(current.func, ast.Attribute):
+                    method = current.func.attr
+                    chain.insert(0, method)
+                    if method in self.QUERY_METHODS:
+                        self._extract_query_arguments(method, current, filters, ordering)
+                    current = current.func.value
+                elif isinstance(current.func, ast.Name) and current.func.id == "super":
+                    model_names = list(context_models)
+                    break
+                else:
+                    break
+            elif isinstance(current, ast.Attribute):
+                if current.attr not in self_accessors:
+                    via_self_ok = False
+                current = current.value
+            elif isinstance(current, ast.Name):
+                if self._find_model(current.id):
+                    model_names = [current.id]
+                elif current.id == "self" and via_self_ok:
+                    model_names = list(context_models)
+                break
+            else:
+                break
+        
+        loads_rows = any(method in self.ROW_LOADING_METHODS for method in chain)
+        if not model_names or (not filters and not ordering and not loads_rows):
+            return None
+        
+        return {
+            "model": model_names[0],
+            "chain": chain,
+            "filters": filters,
+            "ordering": ordering
+        }
+    
+    def _extract_query_arguments(self, method, call, filters, ordering):
+        """Extract lookup kwargs (including Q objects) and order_by fields from a queryset call"""
+        if method == "order_by":
+            for arg in call.args:
+                value = self._extract_value(arg)
+                if isinstance(value, str) and value != "?":
+                    ordering.append(value.lstrip("-"))
+            return
+        
+        # (keyword, connector) pairs; only "and" terms can share a composite index
+        keywords = [(keyword, "and") for keyword in call.keywords
+                    if keyword.arg and keyword.arg not in ["defaults", "create_defaults"]]
+        
+        # Q(...) objects passed positionally, possibly combined with |, & and ~
+        for arg in call.args:
+            self._collect_q_keywords(arg, "and", keywords)
+        
+        for keyword, connector in keywords:
+            path, lookup = self._split_lookup(keyword.arg)
+            filters.append({
+                "method": method,
+                "path": path,
+                "lookup": lookup,
+                "connector": connector
+            })
+    
+    def _collect_q_keywords(self, node, connector, keywords):
+        """Collect Q(...) keywords with their connector: "and", "or" (under |) or "not" (under ~)"""
+        def is_q(item):
+            return isinstance(item, ast.Call) and (
+                (isinstance(item.func, ast.Name) and item.func.id == "Q") or
+                (isinstance(item.func, ast.Attribute) and item.func.attr == "Q")
+            )
+        
+        if is_q(node):
+            keywords.extend((keyword, connector) for keyword in node.keywords if keyword.arg)
+            for arg in node.args:
+                self._collect_q_keywords(arg, connector, keywords)
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitOr, ast.BitAnd)):
+            # Once a term is OR'd or negated it stays out of composites however deep it is nested
+            inner = "or" if isinstance(node.op, ast.BitOr) and connector == "and" else connector
+            self._collect_q_keywords(node.left, inner, keywords)
+            self._collect_q_keywords(node.right, inner, keywords)
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+            self._collect_q_keywords(node.operand, "not", keywords)
+        else:
+            # BoolOp, reduce(operator.or_, ...), variables: the combination is unknown, so never "and"
+            inner = connector if connector != "and" else "or"
+            for item in ast.walk(node):
+                if is_q(item):
+                    keywords.extend((keyword, inner) for keyword in item.keywords if keyword.arg)
+    
+    def _split_lookup(self, lookup_path):
+        """Split 'author__username__iexact' into ('author__username', 'iexact')"""
+        parts = lookup_path.split("__")
+        if len(parts) > 1 and parts[-1] in self.LOOKUP_SUFFIXES:
+            return "__".join(parts[:-1]), parts[-1]
+        return lookup_path, "exact"
+    
+    def _find_model(self, model_name, app=None):
+        """Find a parsed model by class name ("Item") or app label and name ("core.Item").
+        
+        Several apps (or projects in a workspace) can define the same class name, so prefer
+        the model in the referencing app, then one in an app sharing a project with it.
+        """
+        label = None
+        if "." in model_name:
+            label, model_name = model_name.rsplit(".", 1)
+        
+        candidates = [model for model in self.models if model["name"] == model_name]
+        if label:
+            candidates = [model for model in candidates if self._app_label(model["app"]) == label]
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+        
+        if app:
+            same_app = [model for model in candidates if model["app"] == app]
+            if same_app:
+                return same_app[0]
+            projects = self._app_projects(app)
+            same_project = [model for model in candidates if projects & self._app_projects(model["app"])]
+            if same_project:
+                return same_project[0]
+        return candidates[0]
+    
+    def _app_label(self, app_name):
+        """Django app label of a parsed app (workspace apps may carry a project-qualified name)"""
+        app = next((app for app in self.apps if app["name"] == app_name), None)
+        return app.get("label", app_name) if app else app_name
+    
+    def _is_user_model_reference(self, node):
+        """Whether a relation target is settings.AUTH_USER_MODEL or get_user_model()"""
+        if isinstance(node, ast.Attribute):
+            return node.attr == "AUTH_USER_MODEL"
+        if isinstance(node, ast.Call):
+            return (isinstance(node.func, ast.Name) and node.func.id == "get_user_model") or \
+                   (isinstance(node.func, ast.Attribute) and node.func.attr == "get_user_model")
+        return False
+    
+    def _auth_user_model(self, app_name):
+        """AUTH_USER_MODEL ("app_label.Model") in effect for an app, from its project's settings"""
+        # In a workspace use the first project installing the app that overrides it
+        for project in sorted(self._app_projects(app_name)):
+            auth_user_model = self.project_settings.get(project, {}).get("auth_user_model")
+            if auth_user_model:
+                return auth_user_model
+        return self.settings_data.get("auth_user_model") or self.DEFAULT_AUTH_USER_MODEL
+    
+    def _targets_user_model(self, model, relationship, target):
+        """Whether a relationship points at the AUTH_USER_MODEL in effect for the model's app"""
+        if relationship.get("to_user_model"):
+            return True
+        user_label, user_name = self._auth_user_model(model["app"]).rsplit(".", 1)
+        if relationship["related_model"] != user_name:
+            return False
+        if target:
+            return self._app_label(target["app"]) == user_label
+        # Unparsed target (e.g. django.contrib.auth): trust an explicit label, else the imported class name
+        return relationship.get("related_app") in [user_label, None]
+    
+    def _app_projects(self, app_name):
+        """Projects installing an app (empty outside a workspace parse)"""
+        app = next((app for app in self.apps if app["name"] == app_name), None)
+        return set(app.get("projects", [])) if app else set()
+    
+    def _relationship_target(self, model, relationship):
+        """Resolve the model a relationship field points at, preferring the declaring model's app"""
+        if not relationship["related_model"]:
+            return None
+        reference = relationship["related_model"]
+        if relationship.get("related_app"):
+            reference = f"{relationship['related_app']}.{reference}"
+        return self._find_model(reference, model["app"])
+    
+    def _resolve_field_path(self, model, path):
+        """Follow a lookup path across relations; returns (model, field name) of the final column"""
+        segments = path.split("__")
+        for i, segment in enumerate(segments):
+            is_last = i == len(segments) - 1
+            
+            if segment in ["pk", "id"]:
+                return model, "id"
+            
+            field = next((f for f in model["fields"] if f["name"] == segment), None)
+            if field:
+                relationship = next((r for r in model["relationships"] if r["field_name"] == segment), None)
+                if is_last or not relationship:
+                    return model, segment
+                related = self._relationship_target(model, relationship)
+                if not related:
+                    return model, segment
+                model = related
+                continue
+            
+            # Reverse relation (related_name or default lowercase model name)
+            reverse = None
+            for other in self.models:
+                for relationship in other["relationships"]:
+                    if segment in [relationship["related_name"], other["name"].lower()] and \
+                       self._relationship_target(other, relationship) is model:
+                        reverse = other
+                        break
+                if reverse:
+                    break
+            if not reverse or is_last:
+                return None
+            model = reverse
+        return None
+    
+    def _model_indexes(self, model):
+        """List the indexes (as column tuples with their kind) declared or implied for a model"""
+        indexes = [{"fields": ["id"], "type": "btree"}]
+        
+        for field in model["fields"]:
+            attrs = field["attributes"]
+            if attrs.get("primary_key") or attrs.get("unique") or attrs.get("db_index"):
+                indexes.append({"fields": [field["name"]], "type": "btree"})
+            elif field["type"] in ["ForeignKey", "OneToOneField", "SlugField"] and attrs.get("db_index") is not False:
+                # Django indexes these columns implicitly
+                indexes.append({"fields": [field["name"]], "type": "btree"})
+        
+        meta = model.get("meta", {})
+        for key in ["indexes", "constraints"]:
+            for index in meta.get(key) or []:
+                if not isinstance(index, dict):
+                    continue
+                call_name = (index.get("call") or "").split(".")[-1]
+                fields = index["kwargs"].get("fields") or []
+                if key == "constraints" and call_name != "UniqueConstraint":
+                    continue
+                if fields:
+                    indexes.append({
+                        "fields": [str(name).lstrip("-") for name in fields],
+                        "type": "gin" if call_name in ["GinIndex", "GistIndex"] else "btree"
+                    })
+        
+        for key in ["unique_together", "index_together"]:
+            together = meta.get(key) or []
+            if together and all(isinstance(name, str) for name in together):
+                together = [together]
+            for fields in together:
+                if isinstance(fields, list) and fields:
+                    indexes.append({"fields": fields, "type": "btree"})
+        
+        return indexes
+    
+    def _is_index_covered(self, columns, indexes, equality_count):
+        """Check whether an existing index can serve the given columns.
+        
+        The first `equality_count` columns may appear in any order in the index prefix,
+        the remaining columns (range / order_by) must follow in sequence.
+        """
+        for index in indexes:
+            if index["type"] != "btree" or len(index["fields"]) < len(columns):
+                continue
+            prefix = index["fields"][:len(columns)]
+            if set(prefix[:equality_count]) == set(columns[:equality_count]) and \
+               prefix[equality_count:] == columns[equality_count:]:
+                return True
+        return False
+    
+    def _analyze_indexes(self):
+        """Rank missing single-column and composite index candidates from the collected call sites"""
+        try:
+            candidates = {}
+            
+            def add_candidate(model, fields, kind, index_type, method, lookup, call_site):
+                key = (model["app"], model["name"], tuple(fields), index_type)
+                candidate = candidates.setdefault(key, {
+                    "model": model["name"],
+                    "app": model["app"],
+                    "fields": list(fields),
+                    "kind": kind,
+                    "index_type": index_type,
+                    "references": 0,
+                    "methods": defaultdict(int),
+                    "lookups": [],
+                    "call_sites": []
+                })
+                candidate["references"] += 1
+                candidate["methods"][method] += 1
+                if lookup and lookup not in candidate["lookups"]:
+                    candidate["lookups"].append(lookup)
+                location = f"{call_site['file_path']}:{call_site['line']}"
+                if location not in candidate["call_sites"]:
+                    candidate["call_sites"].append(location)
+            
+            range_lookups = ["gt", "gte", "lt", "lte", "range", "date", "year", "month", "day", "startswith"]
+            
+            for call_site in self.query_call_sites:
+                base_model = self._find_model(call_site["model"], call_site["app"])
+                if not base_model or (not call_site["filters"] and not call_site["ordering"]):
+                    # Unfiltered all() querysets are only collected for column-loading checks
+                    continue
+                
+                ordering = call_site["ordering"]
+                if not ordering and "get" not in call_site["chain"]:
+                    # Meta.ordering applies to every query that does not override it
+                    ordering = [str(name).lstrip("-") for name in base_model.get("meta", {}).get("ordering") or []
+                                if isinstance(name, str)]
+                
+                equality_columns = []
+                range_columns = []
+                
+                # Single-column candidates
+                for reference in call_site["filters"]:
+                    resolved = self._resolve_field_path(base_model, reference["path"])
+                    if not resolved:
+                        continue
+                    model, field_name = resolved
+                    
+                    if reference["lookup"] in self.UNINDEXABLE_LOOKUPS:
+                        has_gin = any(index["type"] == "gin" and field_name in index["fields"]
+                                      for index in self._model_indexes(model))
+                        if not has_gin:
+                            add_candidate(model, [field_name], "single", "gin_trgm", reference["method"],
+                                          reference["lookup"], call_site)
+                        continue
+                    
+                    if not self._is_index_covered([field_name], self._model_indexes(model), 1):
+                        add_candidate(model, [field_name], "single", "btree", reference["method"],
+                                      reference["lookup"], call_site)
+                    
+                    # Negated and OR'd lookups rarely drive an index scan, so keep them out of composites
+                    if model is base_model and reference["method"] != "exclude" and reference["connector"] == "and":
+                        if reference["lookup"] in range_lookups:
+                            if field_name not in range_columns:
+                                range_columns.append(field_name)
+                        elif field_name not in equality_columns:
+                            equality_columns.append(field_name)
+                
+                order_columns = []
+                order_fields = []
+                for path in ordering:
+                    resolved = self._resolve_field_path(base_model, path)
+                    if not resolved:
+                        continue
+                    order_fields.append(resolved)
+                    if resolved[0] is base_model:
+                        order_columns.append(resolved[1])
+                
+                # An index on the equality columns followed by the sort columns already serves the sort
+                sort_columns = [column for column in order_columns if column not in equality_columns]
+                sort_served = bool(sort_columns) and self._is_index_covered(
+                    sorted(equality_columns) + sort_columns, self._model_indexes(base_model), len(equality_columns)
+                )
+                
+                for model, field_name in order_fields:
+                    if sort_served and model is base_model:
+                        continue
+                    if not self._is_index_covered([field_name], self._model_indexes(model), 0):
+                        add_candidate(model, [field_name], "single", "btree", "order_by", None, call_site)
+                
+                # Composite candidate: equality columns first, then one range column or the sort columns
+                equality_columns = sorted(equality_columns)
+                trailing = range_columns[:1] if range_columns else [c for c in order_columns if c not in equality_columns]
+                columns = equality_columns + trailing
+                if len(equality_columns) >= 1 and len(columns) >= 2 and \
+                   not self._is_index_covered(columns, self._model_indexes(base_model), len(equality_columns)):
+                    method = "order_by" if not range_columns and trailing else \
+                        next(method for method in reversed(call_site["chain"]) if method in self.QUERY_METHODS)
+                    add_candidate(base_model, columns, "composite", "btree", method, None, call_site)
+            
+            for candidate in candidates.values():
+                candidate["methods"] = dict(candidate["methods"])
+                if candidate["index_type"] == "gin_trgm":
+                    candidate["suggestion"] = (
+                        f"GinIndex(fields={candidate['fields']!r}, opclasses=['gin_trgm_ops'], "
+                        f"name='{candidate['model'].lower()}_{'_'.join(candidate['fields'])}_trgm')"
+                    )
+                else:
+                    candidate["suggestion"] = (
+                        f"models.Index(fields={candidate['fields']!r}, "
+                        f"name='{candidate['model'].lower()}_{'_'.join(candidate['fields'])}_idx')"
+                    )
+                self.index_advice.append(candidate)
+            
+            # Most referenced first; composite before single on ties since they usually subsume it
+            self.index_advice.sort(key=lambda c: (-c["references"], c["kind"] != "composite", c["model"], c["fields"]))
+        except Exception as e:
+            self.errors["parsing"].append(f"Error analyzing indexes: {str(e)}")
+    
+    def _load_cache(self):
+        """Load the per-file parse cache from disk"""
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = json.load(f)
+            if cache.get("version") == self.CACHE_VERSION:
+                self.file_cache = cache.get("files", {})
+        except Exception as e:
+            self.errors["parsing"].append(f"Error loading parse cache: {str(e)}")
+    
+    def _save_cache(self):
+        """Persist the per-file parse cache if anything changed, dropping entries of files not seen this run"""
+        if not self.cache_path:
+            return
+        
+        stale = [key for key in self.file_cache if key not in self.cache_seen]
+        for key in stale:
+            del self.file_cache[key]
+        if not self.cache_dirty and not stale:
+            return
+        
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump({"version": self.CACHE_VERSION, "files": self.file_cache}, f, default=str)
+            self.cache_dirty = False
+        except Exception as e:
+            self.errors["parsing"].append(f"Error saving parse cache: {str(e)}")
+    
+    def _cached_parse(self, file_path, kind, parse_function):
+        """Return the cached result for a file if its mtime and size are unchanged, otherwise re-parse it"""
+        # Parse from the resolved path so cached file paths never depend on the first run's cwd
+        file_path = file_path.resolve()
+        stat = file_path.stat()
+        key = f"{kind}:{file_path}"
+        self.cache_seen.add(key)
+        entry = self.file_cache.get(key)
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["data"]
+        
+        data = parse_function(file_path)
+        self.file_cache[key] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "data": data
+        }
+        self.cache_dirty = True
+        return data
+    
+    def _parse_migrations(self, app_name, app_path):
+        """Parse migrations/*.py statically (without importing) to extract dependencies and operations"""
+        migrations_dir = app_path / "migrations"
+        if not migrations_dir.is_dir():
+            return
+        
+        for migration_file in sorted(migrations_dir.glob("*.py")):
+            if migration_file.name == "__init__.py":
+                continue
+            
+            try:
+                migration = self._cached_parse(migration_file, "migration", self._parse_migration_file)
+                if migration:
+                    migration = dict(migration, app=app_name)
+                    self.migrations.append(migration)
+            except Exception as e:
+                self.errors["parsing"].append(f"Error parsing migration {migration_file}: {str(e)}")
+    
+    def _parse_migration_file(self, migration_file):
+        """Extract the Migration class attributes from a single migration file"""
+        with open(migration_file, "r") as f:
+            file_content = f.read()
+        
+        tree = ast.parse(file_content)
+        
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.ClassDef) or node.name != "Migration":
+                continue
+            
+            migration = {
+                "name": migration_file.stem,
+                "dependencies": [],
+                "replaces": [],
+                "initial": False,
+                "atomic": True,
+                "operations": [],
+                "file_path": str(migration_file)
+            }
+            
+            for item in node.body:
+                if not isinstance(item, ast.Assign):
+                    continue
+                for target in item.targets:
+                    if not isinstance(target, ast.Name):
+                        continue
+                    
+                    if target.id in ["dependencies", "replaces"] and isinstance(item.value, (ast.List, ast.Tuple)):
+                        for dependency in item.value.elts:
+                            value = self._extract_value(dependency)
+                            if isinstance(value, list) and len(value) == 2:
+                                migration[target.id].append(value)
+                            elif isinstance(value, dict) and (value.get("call") or "").endswith("swappable_dependency"):
+                                # swappable_dependency(settings.AUTH_USER_MODEL)
+                                setting = value["args"][0] if value["args"] else None
+                                migration[target.id].append(["__setting__", setting or "unknown"])
+                    
+                    elif target.id in ["initial", "atomic"]:
+                        migration[target.id] = self._extract_value(item.value)
+                    
+                    elif target.id == "operations" and isinstance(item.value, (ast.List, ast.Tuple)):
+                        for operation in item.value.elts:
+                            if not isinstance(operation, ast.Call):
+                                continue
+                            func = operation.func
+                            operation_type = func.attr if isinstance(func, ast.Attribute) else \
+                                func.id if isinstance(func, ast.Name) else None
+                            if not operation_type:
+                                continue
+                            
+                            entry = {"type": operation_type}
+                            for keyword in operation.keywords:
+                                if keyword.arg in ["model_name", "name", "elidable", "old_name", "new_name"]:
+                                    entry[keyword.arg] = self._extract_value(keyword.value)
+                                elif keyword.arg == "field" and isinstance(keyword.value, ast.Call):
+                                    field_keywords = {k.arg: self._extract_value(k.value) for k in keyword.value.keywords if k.arg}
+                                    entry["has_default"] = "default" in field_keywords
+                                    entry["null"] = bool(field_keywords.get("null"))
+                                    entry["field"] = self._migration_field_schema(keyword.value)
+                                elif keyword.arg == "fields" and operation_type == "CreateModel" and \
+                                        isinstance(keyword.value, (ast.List, ast.Tuple)):
+                                    # fields=[("title", models.CharField(max_length=200)), ...]
+                                    entry["fields"] = {
+                                        self._extract_value(item.elts[0]): self._migration_field_schema(item.elts[1])
+                                        for item in keyword.value.elts
+                                        if isinstance(item, ast.Tuple) and len(item.elts) == 2 and isinstance(item.elts[1], ast.Call)
+                                    }
+                            migration["operations"].append(entry)
+            
+            return migration
+        
+        return None
+    
+    def _migration_field_schema(self, call):
+        """Field class and the arguments that shape its database column, from a migration field definition"""
+        func = call.func
+        schema = {"type": func.attr if isinstance(func, ast.Attribute) else func.id if isinstance(func, ast.Name) else None}
+        for keyword in call.keywords:
+            if keyword.arg in self.SCHEMA_FIELD_ATTRIBUTES:
+                value = self._extract_value(keyword.value)
+                # null=False and friends restate the default, so they must not look like a change
+                if value is False and keyword.arg in ["null", "unique", "primary_key"]:
+                    continue
+                schema[keyword.arg] = value
+        if call.args and schema["type"] in ["ForeignKey", "OneToOneField", "ManyToManyField"]:
+            schema["to"] = self._extract_value(call.args[0])
+        return schema
+    
+    def _altered_fields(self, nodes, app_migrations):
+        """Replay each app's field definitions and classify its AlterField operations.
+        
+        Returns {(migration key, operation index): "schema" | "no_schema" | "unknown"}, where
+        "unknown" means the previous definition is not in the parsed migration history.
+        """
+        results = {}
+        for app_name, names in app_migrations.items():
+            fields = {}
+            for name in sorted(names):
+                key = f"{app_name}.{name}"
+                for index, operation in enumerate(nodes[key]["operations"]):
+                    model_name = str(operation.get("model_name") or operation.get("name") or "").lower()
+                    if operation["type"] == "CreateModel":
+                        for field_name, schema in (operation.get("fields") or {}).items():
+                            fields[(model_name, field_name)] = schema
+                    elif operation["type"] == "AddField" and operation.get("field"):
+                        fields[(model_name, operation.get("name"))] = operation["field"]
+                    elif operation["type"] == "RemoveField":
+                        fields.pop((model_name, operation.get("name")), None)
+                    elif operation["type"] == "RenameField":
+                        schema = fields.pop((model_name, operation.get("old_name")), None)
+                        if schema:
+                            fields[(model_name, operation.get("new_name"))] = schema
+                    elif operation["type"] == "AlterField":
+                        previous = fields.get((model_name, operation.get("name")))
+                        current = operation.get("field")
+                        if previous is None or current is None:
+                            results[(key, index)] = "unknown"
+                        else:
+                            results[(key, index)] = "schema" if previous != current else "no_schema"
+                            fields[(model_name, operation.get("name"))] = current
+        return results
+    
+    def _analyze_migrations(self):
+        """Build the cross-app migration DAG and report chain lengths, hotspots, costly operations and squash candidates"""
+        try:
+            nodes = {}
+            for migration in self.migrations:
+                nodes[f"{migration['app']}.{migration['name']}"] = migration
+            
+            app_migrations = defaultdict(list)
+            for migration in self.migrations:
+                app_migrations[migration["app"]].append(migration["name"])
+            
+            # Dependencies name app labels; in a workspace the same label can exist in several
+            # projects, so prefer the app that shares a project with the depending migration
+            apps_by_name = {app["name"]: app for app in self.apps}
+            apps_by_label = defaultdict(list)
+            for app in self.apps:
+                apps_by_label[app.get("label", app["name"])].append(app["name"])
+            
+            def resolve(source_app, app_label, name):
+                candidates = apps_by_label.get(app_label) or [app_label]
+                source_projects = set(apps_by_name.get(source_app, {}).get("projects", []))
+                app_name = next((candidate for candidate in candidates
+                                 if source_projects & set(apps_by_name.get(candidate, {}).get("projects", []))),
+                                candidates[0])
+                
+                # __first__ / __latest__ refer to the first / last migration of an app
+                names = sorted(app_migrations.get(app_name, []))
+                if name == "__first__" and names:
+                    return f"{app_name}.{names[0]}"
+                if name == "__latest__" and names:
+                    return f"{app_name}.{names[-1]}"
+                return f"{app_name}.{name}"
+            
+            edges = []
+            external = set()
+            dependents = defaultdict(list)
+            for key, migration in nodes.items():
+                for app_label, name in migration["dependencies"]:
+                    if app_label == "__setting__" and str(name).endswith("AUTH_USER_MODEL"):
+                        # swappable_dependency(settings.AUTH_USER_MODEL) depends on the user app's first migration
+                        app_label, name = self._auth_user_model(migration["app"]).split(".")[0], "__first__"
+                    target = resolve(migration["app"], app_label, name)
+                    if target not in nodes:
+                        external.add(target)
+                        continue
+                    edges.append({"source": key, "target": target, "cross_app": nodes[target]["app"] != migration["app"]})
+                    dependents[target].append(key)
+            
+            # Longest dependency chain ending at each node (Kahn's algorithm, no recursion)
+            remaining = {key: 0 for key in nodes}
+            for edge in edges:
+                remaining[edge["source"]] += 1
+            queue = [key for key, count in remaining.items() if count == 0]
+            depth = {key: 1 for key in nodes}
+            parent = {}
+            ordered = 0
+            while queue:
+                key = queue.pop()
+                ordered += 1
+                for dependent in dependents[key]:
+                    if depth[key] + 1 > depth[dependent]:
+                        depth[dependent] = depth[key] + 1
+                        parent[dependent] = key
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        queue.append(dependent)
+            if ordered < len(nodes):
+                self.errors["validation"].append("Migration graph contains a dependency cycle")
+            
+            longest_chain = []
+            if depth:
+                key = max(depth, key=lambda k: (depth[k], k))
+                while key:
+                    longest_chain.insert(0, key)
+                    key = parent.get(key)
+            
+            # Migrations many others depend on serialize the graph
+            hotspots = sorted(
+                ({"migration": key, "fan_in": len(keys), "cross_app_fan_in": sum(1 for k in keys if nodes[k]["app"] != nodes[key]["app"])}
+                 for key, keys in dependents.items() if len(keys) > 1),
+                key=lambda h: (-h["fan_in"], h["migration"])
+            )
+            
+            # AlterField only costs something when the column definition really changes
+            altered_fields = self._altered_fields(nodes, app_migrations)
+            
+            costly_operations = []
+            possibly_costly_operations = []
+            for key, migration in nodes.items():
+                for index, operation in enumerate(migration["operations"]):
+                    reason = self.COSTLY_MIGRATION_OPERATIONS.get(operation["type"])
+                    if operation["type"] == "AddField" and not (operation.get("has_default") and not operation.get("null")):
+                        reason = None
+                    if not reason:
+                        continue
+                    entry = {
+                        "migration": key,
+                        "type": operation["type"],
+                        "model_name": operation.get("model_name") or operation.get("name"),
+                        "reason": reason
+                    }
+                    if operation["type"] == "AlterField":
+                        entry["field"] = operation.get("name")
+                        change = altered_fields.get((key, index), "unknown")
+                        if change == "no_schema":
+                            continue
+                        if change == "unknown":
+                            # Previous definition not in the parsed history (e.g. squashed away)
+                            possibly_costly_operations.append(entry)
+                            continue
+                    costly_operations.append(entry)
+            
+            apps = {}
+            squash_candidates = []
+            for app_label, names in app_migrations.items():
+                names = sorted(names)
+                app_keys = [f"{app_label}.{name}" for name in names]
+                squashed = [nodes[k] for k in app_keys if nodes[k]["replaces"]]
+                apps[app_label] = {
+                    "migrations": len(names),
+                    "chain_length": max((depth[k] for k in app_keys), default=0),
+                    "squashed": len(squashed),
+                    "run_python": sum(1 for k in app_keys for op in nodes[k]["operations"] if op["type"] == "RunPython")
+                }
+                
+                # Only migrations after the last squashed one are worth squashing again
+                replaced = {name for migration in squashed for _, name in migration["replaces"]}
+                last_squashed = max((names.index(m["name"]) for m in squashed), default=-1)
+                unsquashed = [name for name in names[last_squashed + 1:] if name not in replaced]
+                if len(unsquashed) >= self.SQUASH_THRESHOLD:
+                    blockers = [
+                        f"{app_label}.{name}" for name in unsquashed
+                        for op in nodes[f"{app_label}.{name}"]["operations"]
+                        if op["type"] in ["RunPython", "RunSQL"] and not op.get("elidable")
+                    ]
+                    squash_candidates.append({
+                        "app": app_label,
+                        "migrations": len(unsquashed),
+                        "start": unsquashed[0],
+                        "end": unsquashed[-1],
+                        "command": f"manage.py squashmigrations {app_label} {unsquashed[0]} {unsquashed[-1]}",
+                        "non_elidable_operations": sorted(set(blockers))
+                    })
+                
+                # Squashed migrations whose replaced files are still on disk are still loaded and parsed
+                leftovers = [name for name in names if name in replaced]
+                if leftovers:
+                    apps[app_label]["replaced_still_present"] = len(leftovers)
+            
+            squash_candidates.sort(key=lambda c: -c["migrations"])
+            
+            # App-level edges for the dependency graph
+            app_edges = defaultdict(int)
+            for edge in edges:
+                if edge["cross_app"]:
+                    app_edges[(nodes[edge["source"]]["app"], nodes[edge["target"]]["app"])] += 1
+            for (source_app, target_app), count in app_edges.items():
+                self.dependencies.append({
+                    "source": source_app,
+                    "source_app": source_app,
+                    "target": target_app,
+                    "type": "migration_depends_on_app",
+                    "count": count
+                })
+            
+            self.migration_graph = {
+                "apps": apps,
+                "edges": edges,
+                "external_dependencies": sorted(external),
+                "longest_chain": longest_chain,
+                "hotspots": hotspots[:20],
+                "costly_operations": costly_operations,
+                "possibly_costly_operations": possibly_costly_operations,
+                "squash_candidates": squash_candidates
+            }
+        except Exception as e:
+            self.errors["parsing"].append(f"Error analyzing migrations: {str(e)}")
+    
+    def _find_serializer(self, serializer_name, app=None):
+        """Find a parsed serializer by class name, preferring the referencing app"""
+        candidates = [serializer for serializer in self.serializers if serializer["name"] == serializer_name]
+        same_app = [serializer for serializer in candidates if serializer["app"] == app]
+        return (same_app or candidates or [None])[0]
+    
+    def _resolve_relation(self, model, name):
+        """Resolve a forward or reverse relation name on a model; returns (related model, is_many) or None"""
+        for relationship in model["relationships"]:
+            if relationship["field_name"] == name:
+                related = self._relationship_target(model, relationship)
+                return related, relationship["type"] == "ManyToManyField"
+        
+        for other in self.models:
+            for relationship in other["relationships"]:
+                if relationship["related_model"] != model["name"] or self._relationship_target(other, relationship) is not model:
+                    continue
+                default_name = other["name"].lower() if relationship["type"] == "OneToOneField" else f"{other['name'].lower()}_set"
+                if name in [relationship["related_name"], default_name]:
+                    return other, relationship["type"] != "OneToOneField"
+        return None
+    
+    def _serializer_field_names(self, serializer, model):
+        """Resolve Meta.fields / '__all__' / exclude (following parent serializers) into field names"""
+        declared = {}
+        meta = {}
+        for parent_name in serializer["parent_serializers"]:
+            parent = self._find_serializer(parent_name, serializer["app"])
+            if parent and parent is not serializer:
+                parent_declared, parent_meta = self._serializer_field_names(parent, model)[1:]
+                declared.update(parent_declared)
+                meta.update(parent_meta)
+        declared.update({field["name"]: field for field in serializer["fields"]})
+        meta.update(serializer["meta"])
+        
+        model_fields = ["id"] + [field["name"] for field in model["fields"]] if model else []
+        fields = meta.get("fields")
+        if fields == "__all__" or (fields is None and meta.get("exclude")):
+            names = model_fields + [name for name in declared if name not in model_fields]
+            names = [name for name in names if name not in (meta.get("exclude") or [])]
+        elif isinstance(fields, list):
+            names = [name for name in fields if isinstance(name, str)]
+        else:
+            names = list(declared)
+        return names, declared, meta
+    
+    def _estimate_serializer_queries(self, serializer, model, eager_loading, prefix="", stack=()):
+        """Estimate the queries issued per serialized object that eager loading does not cover.
+        
+        Returns (queries per object, list of contributing relations).
+        """
+        if not model or serializer["name"] in stack:
+            return 0, []
+        stack = stack + (serializer["name"],)
+        
+        names, declared, meta = self._serializer_field_names(serializer, model)
+        depth = meta.get("depth") or 0
+        
+        queries = 0
+        issues = []
+        loaded = set()
+        
+        def is_eager(path, many):
+            # select_related() without arguments follows every single-valued relation
+            return path in eager_loading["paths"] or (eager_loading["select_all"] and not many)
+        
+        def traverse(path, many, reason):
+            """Count one query for an unprefetched relation hop; single-valued hops are cached per object"""
+            nonlocal queries
+            if is_eager(path, many) or (not many and path in loaded):
+                return
+            loaded.add(path)
+            queries += 1
+            issues.append({"path": path, "many": many, "reason": reason})
+        
+        for name in names:
+            field = declared.get(name)
+            field_type = field["type"] if field else None
+            attrs = field.get("attributes", {}) if field else {}
+            source = attrs.get("source") or name
+            
+            if field_type == "SerializerMethodField":
+                method_name = attrs.get("method_name") or f"get_{name}"
+                method = next((m for m in serializer.get("methods", []) if m["name"] == method_name), None)
+                for access in (method or {}).get("accesses", []):
+                    current = model
+                    path = prefix[:-2]
+                    for segment in access["path"].split("__"):
+                        relation = self._resolve_relation(current, segment) if current else None
+                        if not relation:
+                            break
+                        current, many = relation
+                        path = f"{path}__{segment}" if path else segment
+                        if many and access["call"] in self.UNCACHED_RELATED_CALLS:
+                            # Prefetched results are ignored by filter()/count()/...
+                            queries += 1
+                            issues.append({"path": path, "many": True, "reason": f"{method_name}() calls .{access['call']}()"})
+                        else:
+                            traverse(path, many, f"{method_name}() reads {access['path']}")
+                continue
+            
+            nested = self._find_serializer(field_type, serializer["app"]) if field_type else None
+            relation = self._resolve_relation(model, source) if "." not in source else None
+            path = f"{prefix}{source}"
+            
+            if nested and relation:
+                related, many = relation
+                many = bool(attrs.get("many")) or many
+                traverse(path, many, f"nested {nested['name']}")
+                nested_queries, nested_issues = self._estimate_serializer_queries(
+                    nested, related, eager_loading, f"{path}__", stack
+                )
+                queries += nested_queries * (self.ASSUMED_RELATED_OBJECTS if many else 1)
+                issues.extend(nested_issues)
+            
+            elif "." in source:
+                # source="author.profile.name": every relation hop but the last attribute
+                current = model
+                hop_path = prefix[:-2]
+                for segment in source.split(".")[:-1]:
+                    relation = self._resolve_relation(current, segment) if current else None
+                    if not relation:
+                        break
+                    current, many = relation
+                    hop_path = f"{hop_path}__{segment}" if hop_path else segment
+                    traverse(hop_path, many, f"source=\"{source}\"")
+            
+            elif relation:
+                related, many = relation
+                many = bool(attrs.get("many")) or many
+                if not field and depth > 0:
+                    # Meta.depth nests every relation with an implicit ModelSerializer
+                    traverse(path, many, f"depth={depth}")
+                    implicit = {"name": f"{related['name']}(depth={depth - 1})" if related else name,
+                                "parent_serializers": [], "fields": [], "methods": [],
+                                "meta": {"fields": "__all__", "depth": depth - 1}}
+                    nested_queries, nested_issues = self._estimate_serializer_queries(
+                        implicit, related, eager_loading, f"{path}__", stack
+                    )
+                    queries += nested_queries * (self.ASSUMED_RELATED_OBJECTS if many else 1)
+                    issues.extend(nested_issues)
+                elif field_type in ["StringRelatedField", "SlugRelatedField"] or many or (
+                    # With the default lookup_field="pk" DRF builds the URL from the foreign key column alone
+                    field_type == "HyperlinkedRelatedField" and attrs.get("lookup_field", "pk") != "pk"
+                ):
+                    # Needs the related rows, not just the local foreign key column
+                    traverse(path, many, field_type or "related primary keys")
+        
+        return queries, issues
+    
+    def _estimate_serializer_costs(self):
+        """Rank DRF endpoints by estimated queries per request from their serializer trees"""
+        try:
+            for view in self.views:
+                serializer = self._find_serializer(view.get("serializer_class") or "", view["app"])
+                if not serializer:
+                    continue
+                
+                model_name = serializer["meta"].get("model") or (view["models_used"] or [None])[0]
+                model = self._find_model(model_name or "", serializer["app"])
+                
+                # Every prefix of an eager-loaded lookup is loaded too
+                eager = view.get("eager_loading", {"select_related": [], "prefetch_related": []})
+                paths = set()
+                for lookup in eager["select_related"] + eager["prefetch_related"]:
+                    segments = lookup.split("__")
+                    for i in range(1, len(segments) + 1):
+                        paths.add("__".join(segments[:i]))
+                eager_loading = {"paths": paths, "select_all": "*" in eager["select_related"]}
+                
+                per_object, issues = self._estimate_serializer_queries(serializer, model, eager_loading)
+                
+                is_list = any("List" in parent or "ViewSet" in parent for parent in view.get("parent_views", []))
+                objects = self.ASSUMED_PAGE_SIZE if is_list else 1
+                
+                self.serializer_costs.append({
+                    "view": view["name"],
+                    "app": view["app"],
+                    "serializer": serializer["name"],
+                    "model": model_name,
+                    "kind": "list" if is_list else "detail",
+                    "queries_per_object": per_object,
+                    "estimated_queries": 1 + objects * per_object,
+                    "select_related": eager["select_related"],
+                    "prefetch_related": eager["prefetch_related"],
+                    "unprefetched": issues,
+                    "file_path": view["file_path"]
+                })
+            
+            self.serializer_costs.sort(key=lambda cost: (-cost["estimated_queries"], cost["view"]))
+        except Exception as e:
+            self.errors["parsing"].append(f"Error estimating serializer costs: {str(e)}")
+    
+    def _column_storage(self, field):
+        """Approximate stored bytes of one column per backend, and whether it is a large/out-of-line column"""
+        field_type = field["type"]
+        attrs = field["attributes"]
+        
+        if field_type in self.FIXED_FIELD_BYTES:
+            return list(self.FIXED_FIELD_BYTES[field_type]), False
+        
+        if field_type in ["ForeignKey", "OneToOneField"]:
+            # Column holds the target's primary key (BigAutoField by default)
+            return [8, 8, 4], False
+        
+        if field_type == "DecimalField":
+            digits = attrs.get("max_digits") if isinstance(attrs.get("max_digits"), int) else 10
+            # PostgreSQL numeric: 2 bytes per 4 digits plus header; MySQL: 4 bytes per 9 digits
+            return [4 + 2 * -(-digits // 4), 4 * -(-digits // 9), 8], False
+        
+        if field_type in self.LARGE_FIELD_TYPES:
+            size = self.ASSUMED_LARGE_COLUMN_BYTES
+            return [size + 4, size + 2, size + 3], True
+        
+        max_length = attrs.get("max_length")
+        if not isinstance(max_length, int):
+            max_length = self.DEFAULT_MAX_LENGTHS.get(field_type)
+        if max_length is None:
+            # Unknown custom field: count a pointer-sized column
+            return [8, 8, 8], False
+        
+        # Assume variable-length text is filled to half its limit on average
+        average = max(1, max_length // 2)
+        return [
+            average + (1 if average < 127 else 4),
+            average + (1 if max_length < 256 else 2),
+            average + 2
+        ], max_length > self.TOAST_THRESHOLD_BYTES
+    
+    def _estimate_storage(self):
+        """Annotate each model with approximate row width, out-of-line columns and list views loading them"""
+        try:
+            backends = ["postgresql", "mysql", "sqlite"]
+            
+            def configured_backend(settings_data):
+                engine = settings_data.get("databases", {}).get("default", {}).get("engine") or ""
+                return next((backend for backend in backends if backend in engine), None)
+            
+            for model in self.models:
+                # In a workspace each model uses the database of the project(s) installing its app
+                projects = sorted(self._app_projects(model["app"]))
+                if projects:
+                    configured = sorted({configured_backend(self.project_settings.get(project, {})) or "unknown"
+                                         for project in projects})
+                    configured = configured[0] if len(configured) == 1 else configured
+                else:
+                    configured = configured_backend(self.settings_data)
+                
+                columns = [field for field in model["fields"]
+                           if field["type"] != "ManyToManyField" and
+                           (field["type"].endswith("Field") or field["type"] in ["ForeignKey"])]
+                row_bytes = dict(zip(backends, self.ROW_OVERHEAD_BYTES))
+                out_of_line_bytes = {backend: 0 for backend, pointer in zip(backends, self.OUT_OF_LINE_POINTER_BYTES)
+                                     if pointer is not None}
+                large_columns = []
+                
+                has_primary_key = any(field["attributes"].get("primary_key") for field in columns)
+                if not has_primary_key:
+                    for backend in backends:
+                        row_bytes[backend] += 8
+                
+                for field in columns:
+                    sizes, is_large = self._column_storage(field)
+                    for backend, size, pointer in zip(backends, sizes, self.OUT_OF_LINE_POINTER_BYTES):
+                        if is_large and pointer is not None:
+                            # Only the pointer stays in the row; the value is read from separate pages
+                            row_bytes[backend] += pointer
+                            out_of_line_bytes[backend] += size
+                        else:
+                            row_bytes[backend] += size
+                    if is_large:
+                        large_columns.append(field["name"])
+                
+                column_count = len(columns) + (0 if has_primary_key else 1)
+                too_many_columns = column_count > self.WIDE_TABLE_COLUMNS
+                exceeds_toast = row_bytes["postgresql"] > self.TOAST_THRESHOLD_BYTES
+                exceeds_innodb = row_bytes["mysql"] > self.INNODB_INLINE_ROW_BYTES
+                warnings = []
+                if too_many_columns:
+                    warnings.append(f"{column_count} columns")
+                if exceeds_toast:
+                    warnings.append(f"~{row_bytes['postgresql']} B inline rows exceed the PostgreSQL TOAST threshold")
+                if exceeds_innodb:
+                    warnings.append(f"~{row_bytes['mysql']} B inline rows exceed the InnoDB inline row limit")
+                
+                model["storage"] = {
+                    "row_bytes": row_bytes,
+                    "out_of_line_bytes": out_of_line_bytes,
+                    "configured_backend": configured,
+                    "columns": column_count,
+                    "toast_prone_columns": large_columns,
+                    "wide_table": too_many_columns or exceeds_toast or exceeds_innodb,
+                    "warnings": warnings,
+                    "list_loads": self._find_large_column_loads(model, large_columns) if large_columns else []
+                }
+        except Exception as e:
+            self.errors["parsing"].append(f"Error estimating storage: {str(e)}")
+    
+    def _find_large_column_loads(self, model, large_columns):
+        """Find list views, call sites and serializers that load large columns without only()/defer()"""
+        loads = []
+        
+        def pulled(column_loading):
+            only = set(column_loading.get("only", []))
+            deferred = set(column_loading.get("defer", []))
+            return [column for column in large_columns
+                    if (not only or column in only) and column not in deferred]
+        
+        # Class-based list views / viewsets
+        for view in self.views:
+            if view["type"] != "class" or not any(
+                self._find_model(name, view["app"]) is model for name in view["models_used"]
+            ):
+                continue
+            if not any("List" in parent or "ViewSet" in parent for parent in view.get("parent_views", [])):
+                continue
+            columns = pulled(view.get("column_loading", {}))
+            if not columns:
+                continue
+            
+            load = {"source": view["name"], "kind": "view", "app": view["app"], "columns": columns}
+            serializer = self._find_serializer(view.get("serializer_class") or "", view["app"])
+            if serializer:
+                # Columns the serializer never renders can simply be deferred
+                names = self._serializer_field_names(serializer, model)[0]
+                load["unused_by_serializer"] = [column for column in columns if column not in names]
+            loads.append(load)
+        
+        # Function views: multi-row querysets without only()/defer()/values()
+        for call_site in self.query_call_sites:
+            if call_site.get("class") or self._find_model(call_site["model"], call_site["app"]) is not model:
+                # Querysets inside class-based views are covered above
+                continue
+            if any(method in self.SINGLE_RESULT_METHODS + ["get", "get_or_create", "update_or_create"]
+                   for method in call_site["chain"]):
+                continue
+            if Path(call_site["file_path"]).name not in self.VIEW_FILES:
+                continue
+            if any(method in call_site["chain"] for method in ["only", "defer", "values", "values_list"]):
+                continue
+            loads.append({
+                "source": f"{call_site['file_path']}:{call_site['line']}",
+                "kind": "queryset",
+                "app": call_site["app"],
+                "columns": list(large_columns)
+            })
+        
+        # Serializers that render the large columns (every list endpoint using them loads them)
+        for serializer in self.serializers:
+            model_name = serializer["meta"].get("model")
+            if not isinstance(model_name, str) or self._find_model(model_name, serializer["app"]) is not model:
+                continue
+            names = self._serializer_field_names(serializer, model)[0]
+            columns = [column for column in large_columns if column in names]
+            if columns:
+                loads.append({"source": serializer["name"], "kind": "serializer", "app": serializer["app"], "columns": columns})
+        
+        return loads
+    
     def _extract_value(self, node):
         """Extract value from AST node"""
         if isinstance(node, ast.Str):
@@ -719,7 +2594,7 @@ class DjangoProjectParser:
             return node.value
         elif isinstance(node, ast.Constant):  # Python 3.8+
             return node.value
-        elif isinstance(node, ast.List):
+        elif isinstance(node, (ast.List, ast.Tuple)):
             return [self._extract_value(item) for item in node.elts]
         elif isinstance(node, ast.Dict):
             return {self._extract_value(key): self._extract_value(value) for key, value in zip(node.keys, node.values)}
@@ -727,6 +2602,13 @@ class DjangoProjectParser:
             return node.id
         elif isinstance(node, ast.Attribute):
             return f"{node.value.id}.{node.attr}" if isinstance(node.value, ast.Name) else None
+        elif isinstance(node, ast.Call):
+            # e.g. models.Index(fields=["a", "b"], name="idx") inside Meta.indexes
+            return {
+                "call": self._extract_value(node.func),
+                "args": [self._extract_value(arg) for arg in node.args],
+                "kwargs": {keyword.arg: self._extract_value(keyword.value) for keyword in node.keywords if keyword.arg}
+            }
         return None
     
     def _generate_output(self):
@@ -737,6 +2619,8 @@ class DjangoProjectParser:
                 "totalApps": len(self.apps),
                 "totalModels": len(self.models),
                 "totalViews": len(self.views),
+                "totalIndexCandidates": len(self.index_advice),
+                "totalMigrations": len(self.migrations),
                 "analyzedAt": datetime.datetime.now().isoformat(),
                 "django": {
                     "version": self.django_version,
@@ -749,8 +2633,12 @@ class DjangoProjectParser:
             "urls": self.urls,
             "forms": self.forms,
             "serializers": self.serializers,
+            "admins": self.admins,
             "middleware": self.middleware,
             "dependencies": self.dependencies,
+            "index_advice": self.index_advice,
+            "migrations": self.migration_graph,
+            "serializer_costs": self.serializer_costs,
             "settings": {
                 "databases": self.settings_data.get("databases", {}),
                 "static_url": self.settings_data.get("static_url"),
@@ -760,16 +2648,203 @@ class DjangoProjectParser:
             "errors": self.errors
         }
 
+def _parse_app_task(task):
+    """Parse one app in a fresh parser (module-level so worker processes can run it)"""
+    parser = DjangoProjectParser(task["project_path"], setup_django=False)
+    parser.apps = task["apps"]
+    parser.settings_data = task["settings_data"]
+    parser.project_settings = task["project_settings"]
+    parser.models = task["models"]
+    parser.file_cache = task["file_cache"]
+    return parser._parse_app(task["phase"], task["app"])
+
+
+class DjangoWorkspaceParser:
+    """Parse several Django projects (e.g. a monorepo) into one graph.
+    
+    All projects share a single discovery walk, worker pool and file cache, and
+    library apps installed by more than one project are parsed only once.
+    """
+    
+    # Directories never worth descending into while looking for projects and apps
+    IGNORED_DIRS = ["node_modules", "__pycache__", "venv", "env", "site-packages", "build", "dist"]
+    
+    # Files that mark a directory as a Django app
+    APP_MARKERS = ["models.py", "views.py", "urls.py", "apps.py"]
+    
+    def __init__(self, roots, cache_path=None, workers=1):
+        self.roots = [Path(root).resolve() for root in roots]
+        self.workspace_path = Path(os.path.commonpath([str(root) for root in self.roots]))
+        self.cache_path = cache_path
+        self.workers = workers
+        self.settings_files = []
+        self.app_dirs = defaultdict(list)
+        self.projects = []
+        self.errors = {"parsing": [], "validation": []}
+    
+    def discover(self):
+        """Walk every root once, collecting settings modules and app directories"""
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = sorted(d for d in dirnames if d not in self.IGNORED_DIRS and not d.startswith("."))
+                directory = Path(dirpath)
+                if "settings.py" in filenames:
+                    self.settings_files.append(directory / "settings.py")
+                if any(marker in filenames for marker in self.APP_MARKERS):
+                    self.app_dirs[directory.name].append(directory)
+        return self.settings_files
+    
+    def _project_root(self, settings_file):
+        """The directory holding manage.py above a settings module, or the conventional parent"""
+        root = next(r for r in self.roots if settings_file.is_relative_to(r))
+        directory = settings_file.parent
+        while directory != root and directory != directory.parent:
+            if (directory / "manage.py").exists():
+                return directory
+            directory = directory.parent
+        if (root / "manage.py").exists() or settings_file.parent == root:
+            return root
+        return settings_file.parent.parent
+    
+    def parse(self):
+        """Parse every discovered project and merge the results into a single output"""
+        if not self.settings_files:
+            self.discover()
+        
+        # Per-project settings and app lists
+        apps = {}
+        for settings_file in self.settings_files:
+            project_root = self._project_root(settings_file)
+            project = DjangoProjectParser(project_root, settings_file=settings_file)
+            if project_root == self.workspace_path or any(p.project_name == project.project_name for p in self.projects):
+                project.project_name = os.path.relpath(settings_file.parent, self.workspace_path).replace(os.sep, "/")
+            
+            # Library apps outside the project root: pick the closest directory of that name
+            project.app_locations = {
+                name: max(dirs, key=lambda d: len(os.path.commonpath([str(d), str(project_root)])))
+                for name, dirs in self.app_dirs.items()
+            }
+            project._find_apps()
+            self.projects.append(project)
+            
+            for app in project.apps:
+                app_dir = (project_root / app["path"]).resolve()
+                if app_dir not in apps:
+                    apps[app_dir] = {
+                        "name": app["name"],
+                        "label": app["name"],
+                        "path": os.path.relpath(app_dir, self.workspace_path),
+                        "is_project_app": True,
+                        "projects": []
+                    }
+                apps[app_dir]["projects"].append(project.project_name)
+                app["workspace_app"] = apps[app_dir]
+        
+        # Different apps sharing a label (every service has its own "core") get qualified names
+        labels = defaultdict(list)
+        for app in apps.values():
+            labels[app["label"]].append(app)
+        for same_label in labels.values():
+            if len(same_label) > 1:
+                for app in same_label:
+                    app["name"] = f"{app['projects'][0]}.{app['label']}"
+        
+        # One merged parse over every unique app
+        merged = DjangoProjectParser(self.workspace_path, self.cache_path, workers=self.workers, setup_django=False)
+        merged.apps = list(apps.values())
+        # Settings differ per project, so they are reported under "projects", not at the top level
+        merged.project_settings = {project.project_name: project.settings_data for project in self.projects}
+        if self.projects:
+            merged.django_version = self.projects[0].django_version
+        result = merged._parse_discovered_apps()
+        
+        cross_project = self._mark_cross_project_dependencies(merged)
+        
+        result["metadata"]["totalProjects"] = len(self.projects)
+        result["projects"] = [
+            {
+                "name": project.project_name,
+                "path": os.path.relpath(project.project_path, self.workspace_path),
+                "settings_file": str(project.settings_file),
+                "apps": [app["workspace_app"]["name"] for app in project.apps],
+                "debug": project.debug_mode,
+                "databases": project.settings_data.get("databases", {}),
+                "root_urlconf": project.settings_data.get("root_urlconf"),
+                "errors": project.errors
+            }
+            for project in self.projects
+        ]
+        result["cross_project_dependencies"] = cross_project
+        for kind, messages in self.errors.items():
+            result["errors"][kind].extend(messages)
+        return result
+    
+    def _mark_cross_project_dependencies(self, merged):
+        """Flag dependencies whose endpoints belong to different sets of projects"""
+        app_projects = {app["name"]: set(app["projects"]) for app in merged.apps}
+        
+        cross_project = []
+        for dependency in merged.dependencies:
+            # Targets were resolved in the context of the depending component's app
+            target_app = dependency.get("target_app")
+            if dependency["type"] == "migration_depends_on_app":
+                target_app = dependency["target"]
+            elif dependency["type"] == "url_maps_to_view":
+                views = [view for view in merged.views if view["name"] == dependency["target"]]
+                view = next((v for v in views if v["app"] == dependency["source_app"]), views[0] if views else None)
+                target_app = view["app"] if view else None
+            
+            source_projects = app_projects.get(dependency["source_app"], set())
+            target_projects = app_projects.get(target_app, set())
+            if target_app and source_projects != target_projects:
+                dependency["target_app"] = target_app
+                dependency["cross_project"] = True
+                dependency["source_projects"] = sorted(source_projects)
+                dependency["target_projects"] = sorted(target_projects)
+                cross_project.append(dependency)
+        return cross_project
+
+
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python django_parser.py <path_to_django_project> <output_file_path>")
+    args = sys.argv[1:]
+    
+    usage = "Usage: python django_parser.py [--workers N] <path_to_django_project> [<path> ...] <output_file_path>"
+    
+    # Optional --workers N; parsing stays in-process unless a pool is asked for explicitly
+    workers = 1
+    if "--workers" in args:
+        index = args.index("--workers")
+        value = args[index + 1] if index + 1 < len(args) else ""
+        if not value.isdigit() or int(value) < 1:
+            print(usage)
+            sys.exit(1)
+        workers = int(value)
+        del args[index:index + 2]
+    
+    if len(args) < 2:
+        print(usage)
         sys.exit(1)
     
-    project_path = sys.argv[1]
-    output_file_path = sys.argv[2]
+    project_paths = args[:-1]
+    output_file_path = args[-1]
+    
+    # Keep the per-file parse cache next to the output file so it survives between runs
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(output_file_path)), "python-parser-cache.json")
+    
+    # One walk decides between a single project and a multi-project workspace
+    workspace = DjangoWorkspaceParser(project_paths, cache_path, workers)
+    settings_files = workspace.discover()
     
-    parser = DjangoProjectParser(project_path)
-    result = parser.parse_project()
+    if len(project_paths) == 1 and len(settings_files) <= 1:
+        parser = DjangoProjectParser(
+            project_paths[0], cache_path,
+            settings_file=settings_files[0] if settings_files else None,
+            workers=workers
+        )
+        result = parser.parse_project()
+    else:
+        result = workspace.parse()
+        print(f"Projects: {result['metadata']['totalProjects']}")
     
     # Print brief summary to stdout
     print(f"Project: {result['metadata']['projectName']}")
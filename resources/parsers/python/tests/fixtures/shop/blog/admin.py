@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import Comment
+
+
+@admin.register(Comment)
+class CommentAdmin(admin.ModelAdmin):
+    list_display = ["text"]
+    search_fields = ["text", "post__title__exact"]
+    raw_id_fields = ["post"]
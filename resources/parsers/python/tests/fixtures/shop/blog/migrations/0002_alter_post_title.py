@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="post",
+            name="title",
+            field=models.CharField(max_length=200, help_text="Shown in listings"),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0002_alter_post_title"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="post",
+            name="status",
+            field=models.CharField(max_length=20),
+        ),
+    ]
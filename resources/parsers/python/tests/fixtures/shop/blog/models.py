@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db import models
+
+
+class Author(models.Model):
+    username = models.CharField(max_length=50, unique=True)
+    email = models.EmailField()
+    bio = models.TextField(blank=True)
+
+
+class UserProfile(models.Model):
+    nickname = models.CharField(max_length=30)
+
+
+class Post(models.Model):
+    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name="posts")
+    title = models.CharField(max_length=200)
+    status = models.CharField(max_length=20)
+    body = models.TextField()
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created"]
+        indexes = [models.Index(fields=["status", "created"], name="post_status_created_idx")]
+
+
+class Comment(models.Model):
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="comments")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE)
+    text = models.TextField()
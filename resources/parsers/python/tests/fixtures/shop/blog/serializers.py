@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+from .models import Comment, Post
+
+
+class PostSerializer(serializers.ModelSerializer):
+    author = serializers.HyperlinkedRelatedField(view_name="author-detail", read_only=True)
+
+    class Meta:
+        model = Post
+        fields = ["id", "title", "author"]
+
+
+class CommentSerializer(serializers.ModelSerializer):
+    post = serializers.StringRelatedField()
+
+    class Meta:
+        model = Comment
+        fields = ["id", "text", "post"]
@@ -0,0 +1,34 @@
+from django.db.models import Q
+from django.shortcuts import render
+from django.views.generic import ListView
+
+from .models import Author, Post
+
+
+def search(request):
+    posts = Post.objects.filter(Q(title=request.GET["q"]) | Q(status=request.GET["q"]))
+    return render(request, "blog/search.html", {"posts": posts})
+
+
+def by_status(request, status):
+    posts = Post.objects.filter(status=status).order_by("-created")
+    return render(request, "blog/list.html", {"posts": posts})
+
+
+def by_author(request, author_id):
+    posts = Post.objects.filter(author=author_id, title=request.GET["title"])
+    return render(request, "blog/list.html", {"posts": posts})
+
+
+def author_lookup(request):
+    author = Author.objects.get(email=request.GET["email"])
+    return render(request, "blog/author.html", {"author": author})
+
+
+def index(request):
+    posts = Post.objects.all()
+    return render(request, "blog/index.html", {"posts": posts})
+
+
+class PostList(ListView):
+    model = Post
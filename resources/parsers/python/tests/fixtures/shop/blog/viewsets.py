@@ -0,0 +1,14 @@
+from rest_framework import viewsets
+
+from .models import Comment, Post
+from .serializers import CommentSerializer, PostSerializer
+
+
+class PostViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = Post.objects.only("id", "title", "author")
+    serializer_class = PostSerializer
+
+
+class CommentViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = Comment.objects.all()
+    serializer_class = CommentSerializer
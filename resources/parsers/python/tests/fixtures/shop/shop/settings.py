@@ -0,0 +1,20 @@
+DEBUG = True
+
+INSTALLED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "rest_framework",
+    "accounts",
+    "blog",
+]
+
+ROOT_URLCONF = "shop.urls"
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": "shop",
+    }
+}
+
+AUTH_USER_MODEL = "accounts.Account"
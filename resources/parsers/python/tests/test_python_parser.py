@@ -0,0 +1,150 @@
+"""Checks for python_parser.py against the fixture Django project in fixtures/shop"""
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PARSER = Path(__file__).resolve().parent.parent / "python_parser.py"
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "shop"
+
+
+def run_parser(tmp_path, *args):
+    output = tmp_path / "out.json"
+    completed = subprocess.run(
+        [sys.executable, str(PARSER), *[str(arg) for arg in args], str(output)],
+        capture_output=True, text=True
+    )
+    return completed, output
+
+
+def parse(tmp_path, *args):
+    completed, output = run_parser(tmp_path, *args)
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+    with open(output) as f:
+        return json.load(f)
+
+
+def line_of(location):
+    return int(location.rsplit(":", 1)[1])
+
+
+@pytest.fixture(scope="module")
+def result(tmp_path_factory):
+    return parse(tmp_path_factory.mktemp("shop"), FIXTURE)
+
+
+def test_parses_without_errors(result):
+    assert result["errors"] == {"parsing": [], "validation": []}
+    assert sorted(app["name"] for app in result["apps"]) == ["accounts", "blog"]
+
+
+def test_index_advice(result):
+    advice = {(c["model"], tuple(c["fields"])): c for c in result["index_advice"]}
+
+    assert ("Author", ("email",)) in advice
+    assert advice[("Post", ("author", "title", "created"))]["kind"] == "composite"
+
+    # Q(title=...) | Q(status=...) cannot be served by one composite index
+    search_line = 9
+    for candidate in result["index_advice"]:
+        if candidate["kind"] == "composite":
+            assert search_line not in [line_of(site) for site in candidate["call_sites"]]
+
+    # filter(status=...).order_by("-created") is served by Index(fields=["status", "created"])
+    by_status_line = 14
+    for candidate in result["index_advice"]:
+        assert by_status_line not in [line_of(site) for site in candidate["call_sites"]]
+
+
+def test_migrations(result):
+    migrations = result["migrations"]
+
+    # swappable_dependency(settings.AUTH_USER_MODEL) points at the user app's first migration
+    assert {"source": "blog.0001_initial", "target": "accounts.0001_initial", "cross_app": True} in migrations["edges"]
+    assert migrations["external_dependencies"] == []
+    assert migrations["longest_chain"] == [
+        "accounts.0001_initial", "blog.0001_initial", "blog.0002_alter_post_title", "blog.0003_alter_post_status"
+    ]
+
+    # help_text-only AlterField is a no-op; max_length change is not
+    altered = [(op["migration"], op["field"]) for op in migrations["costly_operations"] if op["type"] == "AlterField"]
+    assert altered == [("blog.0003_alter_post_status", "status")]
+    assert migrations["possibly_costly_operations"] == []
+
+
+def test_serializer_costs(result):
+    costs = {cost["view"]: cost for cost in result["serializer_costs"]}
+
+    # HyperlinkedRelatedField with the default lookup_field only needs the foreign key
+    assert costs["PostViewSet"]["queries_per_object"] == 0
+    assert costs["CommentViewSet"]["queries_per_object"] == 1
+    assert [issue["path"] for issue in costs["CommentViewSet"]["unprefetched"]] == ["post"]
+    assert costs["CommentViewSet"]["estimated_queries"] > costs["PostViewSet"]["estimated_queries"]
+
+
+def test_storage(result):
+    storage = {model["name"]: model["storage"] for model in result["models"]}
+    post = storage["Post"]
+
+    assert post["configured_backend"] == "postgresql"
+    assert post["toast_prone_columns"] == ["body"]
+    assert post["out_of_line_bytes"]["postgresql"] > 1000
+    # The body column only leaves a TOAST pointer in the row
+    assert post["row_bytes"]["postgresql"] < 300
+    assert post["wide_table"] is False
+
+    sources = {load["source"] for load in post["list_loads"]}
+    assert "PostList" in sources
+    assert any(source.endswith("views.py:29") for source in sources)
+
+    # only() on the viewset queryset keeps body out of the list
+    assert "PostViewSet" not in sources
+
+
+def test_admin_findings(result):
+    admin = next(admin for admin in result["admins"] if admin["name"] == "CommentAdmin")
+    findings = [(finding["type"], finding["field"]) for finding in admin["findings"]]
+
+    assert admin["model_app"] == "blog"
+    assert ("search_field_unindexed", "text") in findings
+    assert ("search_field_unindexed", "post__title__exact") not in findings
+
+    # settings.AUTH_USER_MODEL resolves to accounts.Account; UserProfile is not a user table
+    assert ("fk_dropdown_large_table", "user") in findings
+    assert ("fk_dropdown_large_table", "profile") not in findings
+    assert ("fk_dropdown_large_table", "post") not in findings
+
+
+def test_cache_written_next_to_output(tmp_path):
+    parse(tmp_path, FIXTURE)
+    with open(tmp_path / "python-parser-cache.json") as f:
+        cache = json.load(f)
+    assert any(key.startswith("migration:") for key in cache["files"])
+
+
+@pytest.mark.parametrize("workers", [["--workers"], ["--workers", "0"], ["--workers", "two"]])
+def test_invalid_workers_prints_usage(tmp_path, workers):
+    completed, _ = run_parser(tmp_path, *workers, FIXTURE)
+    assert completed.returncode == 1
+    assert completed.stdout.startswith("Usage:")
+
+
+def test_workspace_of_several_roots(tmp_path):
+    roots = []
+    for name in ["svc1", "svc2"]:
+        shutil.copytree(FIXTURE, tmp_path / name)
+        roots.append(tmp_path / name)
+
+    serial = parse(tmp_path, *roots)
+    parallel = parse(tmp_path, "--workers", "2", *roots)
+    for output in [serial, parallel]:
+        output.pop("metadata")
+    assert parallel == serial
+    assert serial["errors"] == {"parsing": [], "validation": []}
+
+    # Same app labels in both projects: each admin must resolve to its own project's model
+    admins = sorted((admin["app"], admin["model_app"]) for admin in serial["admins"])
+    assert admins == [("svc1.blog", "svc1.blog"), ("svc2.blog", "svc2.blog")]
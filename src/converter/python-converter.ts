@@ -352,10 +352,66 @@ function convertDjangoDependencies(djangoDependencies: any): Graph {
     });
   });
   
+  // Create project nodes (multi-project / monorepo analysis)
+  if (djangoDependencies.projects) {
+    djangoDependencies.projects.forEach((project: any) => {
+      const nodeId = generateId('django_project', project.name);
+
+      nodes.push({
+        id: nodeId,
+        title: project.name,
+        type: 'project',
+        sections: [
+          createSection(
+            generateId('sec', `${nodeId}_info`),
+            'Project Info',
+            [
+              createItem(
+                generateId('path', `${project.name}_project_path`),
+                `Path: ${project.path}`,
+                'path'
+              ),
+              createItem(
+                generateId('settings', `${project.name}_settings`),
+                `Settings: ${project.settings_file}`,
+                'info'
+              )
+            ]
+          )
+        ],
+        metadata: {
+          path: project.path,
+          settings_file: project.settings_file,
+          debug: project.debug,
+          databases: project.databases
+        }
+      });
+
+      // Shared library apps get an edge from every project that installs them
+      project.apps.forEach((appName: string) => {
+        const appNodeId = nodeMap.get(`app_${appName}`);
+        if (appNodeId) {
+          edges.push({
+            source: nodeId,
+            target: appNodeId,
+            type: 'contains',
+            metadata: {
+              relationship: 'project_app'
+            }
+          });
+        }
+      });
+    });
+  }
+
   // Create model nodes
   djangoDependencies.models.forEach((model: any) => {
     const nodeId = generateId('django_model', `${model.app}_${model.name}`);
-    nodeMap.set(`model_${model.name}`, nodeId);
+    nodeMap.set(`model_${model.app}.${model.name}`, nodeId);
+    // Bare names resolve to the first model; same-named models in other apps use the qualified key
+    if (!nodeMap.has(`model_${model.name}`)) {
+      nodeMap.set(`model_${model.name}`, nodeId);
+    }
     
     const sections: Section[] = [];
     
@@ -422,6 +478,67 @@ function convertDjangoDependencies(djangoDependencies: any): Graph {
       ));
     }
     
+    // Create storage section (estimated row width and large columns)
+    if (model.storage) {
+      const storage = model.storage;
+      const rowBytes = storage.row_bytes || {};
+      const storageItems: Item[] = [
+        createItem(
+          generateId('row', `${model.name}_row_bytes`),
+          `Inline row ≈ ${rowBytes.postgresql} B (PostgreSQL), ${rowBytes.mysql} B (MySQL), ${rowBytes.sqlite} B (SQLite)`,
+          'info',
+          { row_bytes: rowBytes, configured_backend: storage.configured_backend }
+        )
+      ];
+
+      if (storage.toast_prone_columns.length > 0) {
+        const outOfLine = storage.out_of_line_bytes || {};
+        storageItems.push(createItem(
+          generateId('out_of_line', `${model.name}_out_of_line_bytes`),
+          `Out of line ≈ ${outOfLine.postgresql} B (PostgreSQL), ${outOfLine.mysql} B (MySQL)`,
+          'info',
+          { out_of_line_bytes: outOfLine }
+        ));
+      }
+
+      storageItems.push(createItem(
+        generateId('columns', `${model.name}_columns`),
+        `Columns: ${storage.columns}`,
+        'info'
+      ));
+
+      storage.warnings.forEach((warning: string, index: number) => {
+        storageItems.push(createItem(
+          generateId('warning', `${model.name}_storage_${index}`),
+          `Wide table: ${warning}`,
+          'warning'
+        ));
+      });
+
+      storage.toast_prone_columns.forEach((column: string) => {
+        storageItems.push(createItem(
+          generateId('toast', `${model.name}_${column}`),
+          `Large column: ${column}`,
+          'warning'
+        ));
+      });
+
+      storage.list_loads.forEach((load: any, index: number) => {
+        storageItems.push(createItem(
+          generateId('load', `${model.name}_load_${index}`),
+          `${load.source} loads ${load.columns.join(', ')} without only()/defer()`,
+          'warning',
+          load
+        ));
+      });
+
+      sections.push(createSection(
+        generateId('sec', `${nodeId}_storage`),
+        'Storage',
+        storageItems
+      ));
+    }
+
     nodes.push({
       id: nodeId,
       title: model.name,
@@ -430,6 +547,7 @@ function convertDjangoDependencies(djangoDependencies: any): Graph {
       metadata: {
         app: model.app,
         meta: model.meta,
+        storage: model.storage,
         filePath: model.file_path || `${model.app}/models.py`
       }
     });
@@ -559,16 +677,90 @@ function convertDjangoDependencies(djangoDependencies: any): Graph {
     });
   }
   
+  // Create admin nodes if they exist
+  if (djangoDependencies.admins) {
+    djangoDependencies.admins.forEach((admin: any) => {
+      const nodeId = generateId('django_admin', `${admin.app}_${admin.name}_${admin.model}`);
+
+      const sections: Section[] = [];
+
+      // Create admin options section
+      const optionItems = Object.entries(admin.options || {}).map(([key, value]) => {
+        return createItem(
+          generateId('option', `${admin.name}_${admin.model}_${key}`),
+          `${key} = ${JSON.stringify(value)}`,
+          'info'
+        );
+      });
+
+      if (optionItems.length > 0) {
+        sections.push(createSection(
+          generateId('sec', `${nodeId}_options`),
+          'Options',
+          optionItems
+        ));
+      }
+
+      // Create findings section
+      if (admin.findings && admin.findings.length > 0) {
+        const findingItems = admin.findings.map((finding: any, index: number) => {
+          return createItem(
+            generateId('finding', `${admin.name}_${admin.model}_${index}`),
+            `[${finding.severity}] ${finding.message}`,
+            'warning',
+            finding
+          );
+        });
+
+        sections.push(createSection(
+          generateId('sec', `${nodeId}_findings`),
+          'Findings',
+          findingItems
+        ));
+      }
+
+      nodes.push({
+        id: nodeId,
+        title: admin.name === 'ModelAdmin' ? `ModelAdmin (${admin.model})` : admin.name,
+        type: 'admin',
+        sections,
+        metadata: {
+          app: admin.app,
+          type: admin.type,
+          model: admin.model,
+          findings: admin.findings,
+          filePath: admin.file_path || `${admin.app}/admin.py`
+        }
+      });
+
+      // Add edge from admin to model
+      const modelNodeId = nodeMap.get(`model_${admin.model_app}.${admin.model}`)
+        || nodeMap.get(`model_${admin.model}`);
+      if (modelNodeId) {
+        edges.push({
+          source: nodeId,
+          target: modelNodeId,
+          type: 'uses',
+          metadata: {
+            relationship: admin.type === 'inline' ? 'inline_model' : 'admin_model',
+            findings: (admin.findings || []).length
+          }
+        });
+      }
+    });
+  }
+
   // Create edges for model relationships
   if (djangoDependencies.models) {
     djangoDependencies.models.forEach((model: any) => {
       if (!model.relationships) return;
       
-      const sourceNodeId = nodeMap.get(`model_${model.name}`);
+      const sourceNodeId = nodeMap.get(`model_${model.app}.${model.name}`);
       if (!sourceNodeId) return;
       
       model.relationships.forEach((rel: any) => {
-        const targetNodeId = nodeMap.get(`model_${rel.related_model}`);
+        const targetNodeId = nodeMap.get(`model_${rel.target_app}.${rel.related_model}`)
+          || nodeMap.get(`model_${rel.related_model}`);
         
         if (targetNodeId) {
           edges.push({